@@ -92,11 +92,34 @@ class AlertStore:
         self.alerts_file = alerts_file or Path.home() / ".hybridrag" / "alerts.json"
         self.alerts_file.parent.mkdir(parents=True, exist_ok=True)
         self._alerts: List[Alert] = []
+        self._signature: Optional[tuple] = None  # File (mtime_ns, size) last loaded/saved
+        self._summary: Optional[Dict[str, int]] = None  # Cached get_summary() result
         self._load()
 
+    def _file_signature(self) -> Optional[tuple]:
+        """Get (mtime_ns, size) of the alerts file, or None if it doesn't exist."""
+        try:
+            st = self.alerts_file.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def reload_if_changed(self) -> bool:
+        """Reload alerts if the file was changed by another process (e.g. a watcher).
+
+        Returns:
+            True if the alerts were reloaded
+        """
+        if self._file_signature() == self._signature:
+            return False
+        self._load()
+        return True
+
     def _load(self):
         """Load alerts from file."""
-        if self.alerts_file.exists():
+        self._summary = None
+        self._signature = self._file_signature()
+        if self._signature is not None:
             try:
                 with open(self.alerts_file, 'r') as f:
                     data = json.load(f)
@@ -107,9 +130,11 @@ class AlertStore:
 
     def _save(self):
         """Save alerts to file."""
+        self._summary = None  # Every mutation is followed by a save
         try:
             with open(self.alerts_file, 'w') as f:
                 json.dump({"alerts": [a.to_dict() for a in self._alerts]}, f, indent=2)
+            self._signature = self._file_signature()
         except Exception as e:
             logger.error(f"Could not save alerts: {e}")
 
@@ -160,15 +185,18 @@ class AlertStore:
         self._save()
 
     def get_summary(self) -> Dict[str, int]:
-        """Get summary of unacknowledged alerts by severity."""
-        alerts = self.get_all(include_acknowledged=False)
-        return {
-            "critical": len([a for a in alerts if a.severity == AlertSeverity.CRITICAL]),
-            "error": len([a for a in alerts if a.severity == AlertSeverity.ERROR]),
-            "warning": len([a for a in alerts if a.severity == AlertSeverity.WARNING]),
-            "info": len([a for a in alerts if a.severity == AlertSeverity.INFO]),
-            "total": len(alerts),
-        }
+        """Get summary of unacknowledged alerts by severity.
+
+        Counted in one pass and cached until the alerts change.
+        """
+        if self._summary is None:
+            summary = {"critical": 0, "error": 0, "warning": 0, "info": 0, "total": 0}
+            for alert in self._alerts:
+                if not alert.acknowledged:
+                    summary[alert.severity.value] += 1
+                    summary["total"] += 1
+            self._summary = summary
+        return dict(self._summary)
 
 
 class AlertNotifier:
@@ -254,6 +282,7 @@ class AlertManager:
             return
         self.store = AlertStore()
         self.notifier = AlertNotifier()
+        self._listeners: List[Callable[[], None]] = []
         self._initialized = True
         logger.info("AlertManager initialized")
 
@@ -275,6 +304,7 @@ class AlertManager:
         )
         self.store.add(alert)
         self.notifier.notify(alert)
+        self._notify_listeners()
         return alert
 
     # Convenience methods for common alerts
@@ -394,11 +424,47 @@ class AlertManager:
 
     def acknowledge(self, alert_id: str) -> bool:
         """Acknowledge an alert."""
-        return self.store.acknowledge(alert_id)
+        acknowledged = self.store.acknowledge(alert_id)
+        if acknowledged:
+            self._notify_listeners()
+        return acknowledged
 
     def acknowledge_all(self, database: Optional[str] = None):
         """Acknowledge all alerts."""
         self.store.acknowledge_all(database)
+        self._notify_listeners()
+
+    # Change notification
+
+    def add_listener(self, callback: Callable[[], None]):
+        """Register a callback invoked whenever the alert set changes."""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[], None]):
+        """Unregister a change callback."""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify_listeners(self):
+        """Invoke all change callbacks."""
+        for callback in list(self._listeners):
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Alert listener failed: {e}")
+
+    def check_for_changes(self) -> bool:
+        """Pick up alerts written by other processes.
+
+        A stat() of the alerts file; listeners are notified only if it changed.
+
+        Returns:
+            True if the alerts changed
+        """
+        if self.store.reload_if_changed():
+            self._notify_listeners()
+            return True
+        return False
 
     def enable_desktop_notifications(self):
         """Enable desktop notifications."""
@@ -12,8 +12,6 @@ import atexit
 from textual.app import App
 from textual.binding import Binding
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 
 def _reset_terminal_mouse():
     """Reset terminal mouse tracking modes on exit."""
@@ -28,8 +26,15 @@ def _reset_terminal_mouse():
     except Exception:
         pass  # Ignore errors if stdout is already closed
 
-from src.monitor.screens.dashboard import DashboardScreen
-from src.monitor.screens.wizard import WizardScreen
+if __package__:
+    from .screens.dashboard import DashboardScreen
+    from .screens.wizard import WizardScreen
+else:
+    # Run as a script (python src/monitor/app.py): make the repo root importable.
+    # Package imports (e.g. `from src.monitor import run_monitor`) leave sys.path alone
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from src.monitor.screens.dashboard import DashboardScreen
+    from src.monitor.screens.wizard import WizardScreen
 
 
 class HybridRAGMonitor(App):
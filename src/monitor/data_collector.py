@@ -10,22 +10,35 @@ Collects and aggregates data from various sources:
 """
 
 import json
+import logging
+import os
+import threading
+import time
 import psutil
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Callable
 from datetime import datetime, timedelta
 import re
 
-# Import from parent package
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from src.database_registry import (
+from ..database_registry import (
     DatabaseRegistry, DatabaseEntry,
     get_registry, is_watcher_running
 )
-from src.watch_manager import WatchManager
+from ..watch_manager import WatchManager
+
+logger = logging.getLogger(__name__)
+
+# Default directory scanned for ingestion/watcher logs
+DEFAULT_LOG_DIR = Path(__file__).parent.parent.parent / "logs"
+
+# Files inside a database directory whose changes affect its stats
+_DB_STAT_FILES = (
+    "graph_chunk_entity_relation.graphml",
+    "kv_store_text_chunks.json",
+    "doc_status.json",
+    "database_metadata.json",
+)
 
 
 @dataclass
@@ -571,7 +584,7 @@ def get_recent_logs(
     import subprocess
 
     if log_dir is None:
-        log_dir = Path(__file__).parent.parent.parent / "logs"
+        log_dir = DEFAULT_LOG_DIR
 
     entries = []
 
@@ -679,7 +692,11 @@ def collect_snapshot(registry: Optional[DatabaseRegistry] = None) -> MonitorSnap
 
     databases = get_all_database_stats(registry)
     logs = get_recent_logs(lines=100)
+    return build_snapshot(databases, logs)
+
 
+def build_snapshot(databases: List[DatabaseStats], logs: List[LogEntry]) -> MonitorSnapshot:
+    """Build a snapshot from database stats and logs, aggregating the totals."""
     # Aggregate stats
     watchers_running = sum(1 for db in databases if db.watcher_running)
     watchers_total = len(databases)
@@ -706,17 +723,51 @@ def collect_snapshot(registry: Optional[DatabaseRegistry] = None) -> MonitorSnap
     )
 
 
+def _stat_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) for a path, or None if it cannot be stat'ed."""
+    try:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+    except OSError:
+        return None
+
+
+def _log_dir_signature(log_dir: Path) -> Tuple:
+    """Return a fingerprint of all *.log files in a directory."""
+    signature = []
+    try:
+        with os.scandir(log_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".log"):
+                    st = entry.stat()
+                    signature.append((entry.name, st.st_mtime_ns, st.st_size))
+    except OSError:
+        pass
+    return tuple(sorted(signature))
+
+
 class DataCollector:
     """
     Continuous data collector for the monitor.
 
     Maintains cached state and provides efficient updates.
+
+    Besides on-demand refresh(), the collector can watch its inputs
+    (registry, watcher PID files, logs, database files) with a cheap stat
+    fingerprint and push a fresh snapshot to subscribers only when something
+    changed. See subscribe() and start_change_watch().
     """
 
     def __init__(self, registry: Optional[DatabaseRegistry] = None):
         self.registry = registry or get_registry()
         self.watch_manager = WatchManager(self.registry)
         self._last_snapshot: Optional[MonitorSnapshot] = None
+        self.last_refresh_duration = 0.0  # Seconds taken by the last refresh()
+        self._refresh_lock = threading.Lock()  # refresh() runs from several threads
+        self._subscribers: List[Callable[[MonitorSnapshot], None]] = []
+        self._watch_thread: Optional[threading.Thread] = None
+        self._watch_stop = threading.Event()
+        self._watch_interval = 1.0
 
     def reload(self) -> None:
         """Reload registry from disk to pick up external changes.
@@ -734,9 +785,12 @@ class DataCollector:
         BUG-006 fix: Always reload registry from disk before collecting snapshot
         to ensure we capture changes from external processes (watcher, CLI).
         """
-        self.reload()  # Reload registry from disk first
-        self._last_snapshot = collect_snapshot(self.registry)
-        return self._last_snapshot
+        with self._refresh_lock:
+            t0 = time.perf_counter()
+            self.reload()  # Reload registry from disk first
+            self._last_snapshot = collect_snapshot(self.registry)
+            self.last_refresh_duration = time.perf_counter() - t0
+            return self._last_snapshot
 
     def get_snapshot(self) -> Optional[MonitorSnapshot]:
         """Get last collected snapshot."""
@@ -827,3 +881,92 @@ class DataCollector:
 
         except Exception as e:
             return False, f"Failed to trigger sync: {e}"
+
+    def subscribe(self, callback: Callable[[MonitorSnapshot], None]) -> None:
+        """Register a callback receiving snapshots when monitored data changes.
+
+        Callbacks run on the change-watch thread.
+        """
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[MonitorSnapshot], None]) -> None:
+        """Remove a previously registered callback."""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def start_change_watch(self, interval: float = 1.0) -> None:
+        """Start the background thread that notifies subscribers on changes."""
+        self._watch_interval = interval
+        if self._watch_thread and self._watch_thread.is_alive():
+            return
+        # A fresh event per thread: a previous thread that outlived
+        # stop_change_watch's join still sees its own event set and exits
+        self._watch_stop = threading.Event()
+        self._watch_thread = threading.Thread(
+            target=self._change_watch_loop,
+            args=(self._watch_stop,),
+            name="monitor-change-watch",
+            daemon=True
+        )
+        self._watch_thread.start()
+
+    def stop_change_watch(self) -> None:
+        """Stop the change-watch thread, waiting briefly for it to exit."""
+        self._watch_stop.set()
+        thread, self._watch_thread = self._watch_thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=2.0)
+
+    def set_change_watch_interval(self, interval: float) -> None:
+        """Change how often the change-watch thread checks for changes."""
+        self._watch_interval = interval
+
+    def _change_fingerprint(self) -> Tuple:
+        """Cheap stat-only fingerprint of everything a snapshot is built from."""
+        parts: List[Any] = [
+            _stat_signature(self.registry.registry_path),
+            _stat_signature(DatabaseRegistry.DEFAULT_DIR / "watchers"),
+            _log_dir_signature(DEFAULT_LOG_DIR),
+        ]
+        for entry in self.registry.list_all():
+            db_path = Path(entry.path)
+            parts.append(_stat_signature(db_path))
+            parts.extend(_stat_signature(db_path / name) for name in _DB_STAT_FILES)
+            if entry.source_folder:
+                parts.append(_stat_signature(Path(entry.source_folder)))
+            # CWD-relative watcher log read for processing_progress
+            parts.append(_stat_signature(Path("logs") / f"watcher_{entry.name}.log"))
+        return tuple(parts)
+
+    def _change_watch_loop(self, stop: threading.Event) -> None:
+        """Poll the fingerprint and push a snapshot to subscribers on change.
+
+        The first fingerprint is only a baseline: subscribers are expected to
+        have refreshed once themselves.
+        """
+        last = None
+        while True:
+            try:
+                fingerprint = self._change_fingerprint()
+            except Exception as e:
+                # Usually a file replaced mid-stat; the next tick retries
+                logger.debug(f"Change watch: fingerprint failed: {e}")
+                fingerprint = last
+
+            if last is not None and fingerprint != last and self._subscribers:
+                try:
+                    snapshot = self.refresh()
+                except Exception as e:
+                    logger.warning(f"Change watch: snapshot refresh failed: {e}")
+                    snapshot = None
+                if snapshot is not None:
+                    for callback in list(self._subscribers):
+                        try:
+                            callback(snapshot)
+                        except Exception as e:
+                            logger.warning(f"Change watch: subscriber {callback!r} failed: {e}")
+            last = fingerprint
+
+            if stop.wait(self._watch_interval):
+                break
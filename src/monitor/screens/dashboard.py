@@ -5,7 +5,12 @@ Dashboard Screen
 Main monitoring dashboard showing databases, watchers, and activity.
 """
 
+from functools import lru_cache
 from pathlib import Path
+import asyncio
+import math
+from typing import Callable
+from textual import work
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import Static, Footer
@@ -13,18 +18,77 @@ from textual.containers import Container, Horizontal
 from textual.binding import Binding
 from textual.reactive import reactive
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+from ..data_collector import DataCollector, DatabaseStats, LogEntry, MonitorSnapshot, build_snapshot
+from ..widgets.database_table import DatabaseTable
+from ..widgets.watcher_panel import WatcherPanel
+from ..widgets.activity_log import ActivityLog
+from ..widgets.action_panel import ActionPanel
+from ..widgets.status_bar import StatusBar
+from ..widgets.history_panel import HistoryPanel
+from ..widgets.source_files_panel import SourceFilesPanel
+from ..widgets.alerts_panel import AlertsSummaryWidget
+from .wizard import WizardScreen
 
-from src.monitor.data_collector import DataCollector, DatabaseStats, MonitorSnapshot
-from src.monitor.widgets.database_table import DatabaseTable
-from src.monitor.widgets.watcher_panel import WatcherPanel
-from src.monitor.widgets.activity_log import ActivityLog
-from src.monitor.widgets.action_panel import ActionPanel
-from src.monitor.widgets.status_bar import StatusBar
-from src.monitor.widgets.history_panel import HistoryPanel
-from src.monitor.widgets.source_files_panel import SourceFilesPanel
-from src.monitor.widgets.alerts_panel import AlertsSummaryWidget
+
+@lru_cache(maxsize=256)
+def _format_path_cached(path: str) -> str:
+    """Format a path for display, showing symlink targets (BUG-007 fix).
+
+    Memoized per path string so repeated info displays skip the
+    is_symlink()/resolve() syscalls.
+    """
+    p = Path(path)
+    if p.is_symlink():
+        try:
+            target = p.resolve()
+            return f"{path} → {target}"
+        except (OSError, RuntimeError):
+            return f"{path} [symlink]"
+    return path
+
+
+@lru_cache(maxsize=64)
+def _format_info(
+    name: str,
+    path: str | None,
+    source_folder: str | None,
+    source_type: str,
+    size_human: str,
+    entity_count: int,
+    relation_count: int,
+    chunk_count: int,
+    last_sync_human: str,
+    auto_watch: bool,
+    model: str | None,
+    errors: tuple[str, ...],
+) -> str:
+    """Render the info popup text for a database.
+
+    Keyed on every displayed field, so a changed database gets a new entry
+    and stale ones age out of the LRU.
+    """
+    # BUG-007 fix: Show symlink targets for path display
+    path = _format_path_cached(path) if path else "N/A"
+    source = _format_path_cached(source_folder) if source_folder else "N/A"
+
+    text = (
+        f"[bold]Database: {name}[/bold]\n"
+        f"Path: {path}\n"
+        f"Source: {source}\n"
+        f"Type: {source_type}\n"
+        f"Size: {size_human}\n"
+        f"Entities: {entity_count:,}\n"
+        f"Relations: {relation_count:,}\n"
+        f"Chunks: {chunk_count:,}\n"
+        f"Last Sync: {last_sync_human}\n"
+        f"Auto-watch: {'Yes' if auto_watch else 'No'}\n"
+        f"Model: {model or 'default'}"
+    )
+
+    if errors:
+        text += "\n\n[red]Errors:[/red]\n" + "\n".join(f"  - {err}" for err in errors)
+
+    return text
 
 
 class DashboardScreen(Screen):
@@ -79,169 +143,58 @@ class DashboardScreen(Screen):
         "activity-log",       # Bottom-right
     ]
 
-    CSS = """
-    DashboardScreen {
-        layout: grid;
-        grid-size: 1;
-        grid-rows: auto 12 10 12 1fr auto auto;
-    }
-
-    #header-row {
-        height: 3;
-        background: $surface;
-        color: $text;
-        padding: 0 2;
-    }
-
-    #header-title {
-        text-style: bold;
+    # Seconds between safety-net full refreshes; regular updates are pushed by
+    # the collector when its inputs change
+    SAFETY_REFRESH_INTERVAL = 30
+
+    # Notification prefixes for operation results
+    _SUCCESS_PREFIX = "✓ "
+    _FAILURE_PREFIX = "✗ "
+
+    # Panel ID -> Tab order index (resolved by walking focused ancestors)
+    _PANEL_ID_TO_IDX = {panel_id: idx for idx, panel_id in enumerate(PANEL_IDS)}
+
+    # Panel ID -> main section (grid row) containing it
+    _PANEL_SECTION_MAP = {
+        "history-panel": "timeline-section",
+        "database-table": "database-section",
+        "watcher-panel": "watcher-actions-row",
+        "action-panel": "watcher-actions-row",
+        "source-files-panel": "bottom-row",
+        "activity-log": "bottom-row",
     }
 
-    #alerts-summary {
-        dock: right;
-        width: auto;
-        padding: 0 2;
+    # Panel ID -> cell for panels in split rows
+    _PANEL_CELL_MAP = {
+        "watcher-panel": "watcher-cell",
+        "action-panel": "action-cell",
+        "source-files-panel": "source-files-cell",
+        "activity-log": "activity-log-cell",
     }
 
-    /* Row 2: Full-width timeline section */
-    #timeline-section {
-        height: 100%;
-        padding: 0 1;
-    }
+    # Main sections (rows in the grid)
+    _ALL_SECTIONS = ("timeline-section", "database-section", "watcher-actions-row", "bottom-row")
 
-    /* Row 3: Full-width database table section */
-    #database-section {
-        height: 100%;
-        padding: 0 1;
-    }
+    # Cells inside the split (two-column) rows
+    _SPLIT_CELLS = ("watcher-cell", "action-cell", "source-files-cell", "activity-log-cell")
 
-    /* Row 4: Watcher + Actions row: 1x2 side by side */
-    #watcher-actions-row {
-        height: 100%;
-        layout: grid;
-        grid-size: 2 1;
-        grid-columns: 1fr 1fr;
-        padding: 0 1;
+    # Cell -> its neighbour in the same split row
+    _SIBLING_CELLS = {
+        "watcher-cell": "action-cell",
+        "action-cell": "watcher-cell",
+        "source-files-cell": "activity-log-cell",
+        "activity-log-cell": "source-files-cell",
     }
 
-    #watcher-cell {
-        height: 100%;
-        width: 100%;
-    }
-
-    #action-cell {
-        height: 100%;
-        width: 100%;
-    }
-
-    /* Row 5: Bottom row: Source Files + Activity Log */
-    #bottom-row {
-        height: 100%;
-        layout: grid;
-        grid-size: 2 1;
-        grid-columns: 1fr 1fr;
-        padding: 0 1;
-    }
-
-    #source-files-cell {
-        height: 100%;
-        width: 100%;
-    }
+    # Rows laid out as two-column grids
+    _SPLIT_ROWS = ("watcher-actions-row", "bottom-row")
 
-    #activity-log-cell {
-        height: 100%;
-        width: 100%;
-    }
-
-    /* When a cell is maximized, it takes full width */
-    .maximized-cell {
-        grid-columns: 1fr;
-        grid-size: 1 1;
-    }
-
-    #watcher-panel {
-        height: 100%;
-    }
-
-    #source-files-panel {
-        height: 100%;
-    }
-
-    #action-panel {
-        height: 100%;
-    }
-
-    #activity-log {
-        height: 100%;
-    }
-
-    #history-panel {
-        height: 100%;
-    }
-
-    #database-table {
-        height: 100%;
-    }
-
-    #status-bar {
-        height: 1;
-        background: $surface;
-        padding: 0 1;
-    }
+    # Styles live in dashboard.tcss (resolved relative to this module)
+    CSS_PATH = "dashboard.tcss"
 
-    DatabaseTable {
-        height: 100%;
-        border: none;
-    }
-
-    WatcherPanel {
-        height: 100%;
-    }
-
-    ActionPanel {
-        height: 100%;
-    }
-
-    ActivityLog {
-        height: 100%;
-        border: none;
-    }
-
-    HistoryPanel {
-        height: 100%;
-    }
-
-    SourceFilesPanel {
-        height: 100%;
-    }
-
-    .panel-hidden {
-        display: none;
-    }
-
-    /* Maximized mode: panel takes full height */
-    .maximized-mode {
-        grid-rows: auto 1fr auto auto;
-    }
-
-    /* Visual highlight when panels are focused */
-    WatcherPanel:focus,
-    SourceFilesPanel:focus,
-    ActionPanel:focus,
-    HistoryPanel:focus {
-        border: solid cyan;
-    }
-
-    DatabaseTable:focus {
-        border: solid cyan;
-    }
-
-    ActivityLog:focus {
-        border: solid cyan;
-    }
-    """
-
-    selected_database: reactive[DatabaseStats | None] = reactive(None)
+    selected_database: reactive[DatabaseStats | None] = reactive(
+        None, layout=False, repaint=False, init=False, always_update=True
+    )
     snapshot: reactive[MonitorSnapshot | None] = reactive(None)
     maximized_panel: reactive[str | None] = reactive(None)
 
@@ -250,8 +203,34 @@ class DashboardScreen(Screen):
         self.refresh_interval = refresh_interval
         self.collector = DataCollector()
         self._refreshing = False  # Guard against concurrent refreshes
+        self._layout_nodes: dict = {}  # Section/cell containers, cached on mount
+        self._log_subscribers: list[Callable[[list[LogEntry]], None]] = []
+        self._refresh_timer = None  # Safety-net auto-refresh Timer
+        self._effective_interval = refresh_interval  # Change-watch interval, stretched under load
+        self._refresh_cost = 0.0  # EWMA of refresh duration in seconds
+        self._last_applied: MonitorSnapshot | None = None  # Snapshot last pushed to widgets
+        self._history_hour: int | None = None  # Hour the timeline was last bucketed in
+        self._deferred_history_logs: list[LogEntry] | None = None  # Held while timeline is hidden
+        self._source_files_stale = False  # Source files skipped while hidden
 
     def compose(self) -> ComposeResult:
+        # Keep direct references to the widgets updated on every refresh,
+        # so hot paths don't re-run query_one selector walks
+        self._history_panel = HistoryPanel(id="history-panel")
+        self._db_table = DatabaseTable(id="database-table")
+        self._watcher_panel = WatcherPanel(id="watcher-panel")
+        self._action_panel = ActionPanel(id="action-panel")
+        self._source_files_panel = SourceFilesPanel(id="source-files-panel")
+        self._activity_log = ActivityLog(id="activity-log")
+        self._status_bar = StatusBar(refresh_interval=self.refresh_interval, id="status-bar")
+        self._panels = {
+            panel.id: panel
+            for panel in (
+                self._history_panel, self._db_table, self._watcher_panel,
+                self._action_panel, self._source_files_panel, self._activity_log,
+            )
+        }
+
         # Header with alerts summary
         yield Horizontal(
             Static("🔮 [bold]HybridRAG Monitor[/bold]", id="header-title"),
@@ -261,24 +240,24 @@ class DashboardScreen(Screen):
 
         # Full-width 24-hour timeline at top
         yield Container(
-            HistoryPanel(id="history-panel"),
+            self._history_panel,
             id="timeline-section"
         )
 
         # Full-width database table
         yield Container(
-            DatabaseTable(id="database-table"),
+            self._db_table,
             id="database-section"
         )
 
         # Watcher + Actions row: side by side (1x2)
         yield Horizontal(
             Container(
-                WatcherPanel(id="watcher-panel"),
+                self._watcher_panel,
                 id="watcher-cell"
             ),
             Container(
-                ActionPanel(id="action-panel"),
+                self._action_panel,
                 id="action-cell"
             ),
             id="watcher-actions-row"
@@ -287,203 +266,323 @@ class DashboardScreen(Screen):
         # Bottom row: Source Files + Activity Log
         yield Horizontal(
             Container(
-                SourceFilesPanel(id="source-files-panel"),
+                self._source_files_panel,
                 id="source-files-cell"
             ),
             Container(
-                ActivityLog(id="activity-log"),
+                self._activity_log,
                 id="activity-log-cell"
             ),
             id="bottom-row"
         )
 
         # Status bar
-        yield StatusBar(refresh_interval=self.refresh_interval, id="status-bar")
+        yield self._status_bar
 
         # Footer with keybindings
         yield Footer()
 
     def on_mount(self) -> None:
         """Initialize dashboard on mount."""
-        self.action_refresh()
-        # Set up auto-refresh timer
-        self.set_interval(self.refresh_interval, self._auto_refresh)
+        # Cache layout containers toggled by maximize/restore
+        self._layout_nodes = {
+            node_id: self.query_one(f"#{node_id}")
+            for node_id in (*self._ALL_SECTIONS, *self._SPLIT_CELLS)
+        }
+        # Widgets fed from snapshot.recent_logs
+        self._log_subscribers = [
+            self._activity_log.update_entries,
+            self._feed_history,
+        ]
+        # Paint the empty layout first; collect data on the next tick
+        self.call_after_refresh(self.action_refresh)
+        # Event-driven updates: the collector pushes a snapshot when its inputs
+        # change; the timer is only a safety net (time-relative fields, missed events)
+        self.collector.subscribe(self._on_data_changed)
+        self.collector.start_change_watch(self.refresh_interval)
+        self._refresh_timer = self.set_interval(self.SAFETY_REFRESH_INTERVAL, self._auto_refresh)
+
+    def on_unmount(self) -> None:
+        """Stop collector change notifications."""
+        self.collector.unsubscribe(self._on_data_changed)
+        self.collector.stop_change_watch()
+
+    def _on_data_changed(self, snapshot: MonitorSnapshot) -> None:
+        """Collector callback (change-watch thread): apply snapshot on the UI thread."""
+        self.app.call_from_thread(self._apply_snapshot, snapshot)
 
     def _auto_refresh(self) -> None:
-        """Auto-refresh callback."""
-        self.action_refresh()
+        """Auto-refresh callback: start a refresh unless one is still in flight.
+
+        Overlapping ticks are dropped rather than queued. (An exclusive worker
+        would cancel the in-flight refresh instead, so under sustained load no
+        refresh would ever complete.)
+        """
+        if not self._refreshing:
+            self._run_auto_refresh()
+
+    @work(group="refresh")
+    async def _run_auto_refresh(self) -> None:
+        """Worker running one auto-refresh tick."""
+        await self.action_refresh()
 
-    def action_refresh(self) -> None:
-        """Refresh all data."""
+    async def action_refresh(self) -> None:
+        """Refresh all data.
+
+        The collector does file/registry/log I/O, so it runs in a thread;
+        the event loop keeps handling input while the snapshot is collected.
+        """
         # Guard against concurrent refreshes
         if self._refreshing:
             return
         self._refreshing = True
 
         try:
-            snapshot = self.collector.refresh()
-            self.snapshot = snapshot
-
-            # Update database table
-            table = self.query_one("#database-table", DatabaseTable)
-            table.update_databases(snapshot.databases)
-
-            # Update status bar
-            status_bar = self.query_one("#status-bar", StatusBar)
-            status_bar.snapshot = snapshot
-
-            # Update activity log (copy list to prevent shared mutation)
-            log = self.query_one("#activity-log", ActivityLog)
-            log.update_entries(list(snapshot.recent_logs))
-
-            # Update history panel (copy list to prevent shared mutation)
-            history = self.query_one("#history-panel", HistoryPanel)
-            history.update_entries(list(snapshot.recent_logs))
-
-            # Explicitly update panels with selected database
-            # This ensures panels get data even if message wasn't received
-            selected_db = table.get_selected_database()
-            if selected_db:
-                self._update_panels_for_database(selected_db)
-            elif snapshot.databases:
-                # Fallback: use first database if selection not working
-                self._update_panels_for_database(snapshot.databases[0])
-
+            snapshot = await asyncio.to_thread(self.collector.refresh)
+            self._apply_snapshot(snapshot)
         except Exception as e:
             self.notify(f"Refresh error: {e}", severity="error")
         finally:
             self._refreshing = False
 
-    def _update_panels_for_database(self, db: DatabaseStats) -> None:
-        """Update all panels with selected database info.
+    def _apply_snapshot(self, snapshot: MonitorSnapshot, record_cost: bool = True) -> None:
+        """Push a collected snapshot to the widgets (UI thread only).
 
-        BUG FIX: Force explicit updates instead of relying on reactive watchers.
-        Textual's reactive system uses equality comparison, so if DatabaseStats
-        fields are identical between refreshes, watchers won't fire. We now
-        explicitly call render/update methods to ensure panels always refresh.
+        record_cost=False for snapshots patched locally rather than collected,
+        which must not feed the refresh latency estimate.
         """
-        self.selected_database = db
+        last = self._last_applied
+        if last is not None and snapshot.timestamp < last.timestamp:
+            return  # A newer snapshot was already applied
+        self.snapshot = snapshot
 
-        # Update watcher panel - force render to bypass reactive equality check
-        watcher_panel = self.query_one("#watcher-panel", WatcherPanel)
-        watcher_panel.database = db
-        watcher_panel.update(watcher_panel._render_watcher(db))
+        try:
+            # Diff against the last applied snapshot so idle ticks only touch
+            # what actually changed (dataclass equality compares all fields)
+            dbs_changed = last is None or snapshot.databases != last.databases
+            logs_changed = last is None or snapshot.recent_logs != last.recent_logs
+            hour = snapshot.timestamp.hour
+            history_stale = dbs_changed or logs_changed or hour != self._history_hour
+            self._last_applied = snapshot
+            self._history_hour = hour
+
+            # Apply all widget updates as a single frame; batch_update ends
+            # the batch even if one of the updates raises
+            with self.app.batch_update():
+                table = self._db_table
+                if dbs_changed:
+                    # Update database table and status bar (totals derive from databases)
+                    table.update_databases(snapshot.databases)
+                    self._status_bar.snapshot = snapshot
+
+                if logs_changed:
+                    # Hand the same log list to every log consumer
+                    self._broadcast_logs(snapshot.recent_logs)
+                elif history_stale:
+                    # The history panel also reads ingestion history from database
+                    # metadata and buckets by hour, so it refreshes on database
+                    # changes and hour rollover even when the logs are unchanged
+                    self._feed_history(list(snapshot.recent_logs))
+
+                # On database changes the table re-posts DatabaseSelected with the
+                # fresh stats of its cursor row, which updates the detail panels.
+                # Source files come from the filesystem, not the snapshot, so
+                # keep rescanning them on unchanged ticks.
+                if not dbs_changed:
+                    if self._is_panel_hidden("source-files-panel"):
+                        self._source_files_stale = True
+                    else:
+                        self._source_files_panel.refresh_files()
 
-        # Update source files panel - force file list refresh from filesystem
-        source_files_panel = self.query_one("#source-files-panel", SourceFilesPanel)
-        source_files_panel.database = db
-        source_files_panel.refresh_files()
+        except Exception as e:
+            self.notify(f"Refresh error: {e}", severity="error")
+
+        if record_cost:
+            self._record_refresh_cost(self.collector.last_refresh_duration)
 
-        # Update action panel - force render to bypass reactive equality check
-        action_panel = self.query_one("#action-panel", ActionPanel)
-        action_panel.database = db
-        action_panel.update(action_panel._render_actions(db))
+    def _broadcast_logs(self, logs: list[LogEntry]) -> None:
+        """Push one copy of the recent logs to all log subscribers."""
+        logs = list(logs)  # Copy once to prevent shared mutation with the snapshot
+        for callback in self._log_subscribers:
+            callback(logs)
+
+    def _is_panel_hidden(self, panel_id: str) -> bool:
+        """Whether a panel is hidden because another panel is maximized."""
+        return self.maximized_panel not in (None, panel_id)
+
+    def _feed_history(self, logs: list[LogEntry]) -> None:
+        """Update the timeline, or hold the logs while it is hidden."""
+        if self._is_panel_hidden("history-panel"):
+            self._deferred_history_logs = logs
+        else:
+            self._history_panel.update_entries(logs)
+
+    def _flush_deferred_panels(self) -> None:
+        """Catch up panels whose updates were skipped while hidden."""
+        if self._deferred_history_logs is not None:
+            self._history_panel.update_entries(self._deferred_history_logs)
+            self._deferred_history_logs = None
+        if self._source_files_stale:
+            self._source_files_stale = False
+            self._push_database(self._source_files_panel, self.selected_database)
+
+    def _record_refresh_cost(self, elapsed: float) -> None:
+        """Track collector latency and adapt the refresh interval.
+
+        An interval shorter than the refresh itself only piles new refreshes
+        onto stale ones, so the change-watch interval is stretched to
+        max(refresh_interval, 1.5 * EWMA latency) (shown on the status bar).
+        It shrinks back once the latency drops below a third of the current
+        interval, which keeps small jitter from flapping the interval.
+        """
+        if self._refresh_cost:
+            self._refresh_cost = 0.8 * self._refresh_cost + 0.2 * elapsed
+        else:
+            self._refresh_cost = elapsed
+
+        target = max(self.refresh_interval, math.ceil(1.5 * self._refresh_cost))
+        if target > self._effective_interval or (
+            target < self._effective_interval
+            and 3 * self._refresh_cost <= self._effective_interval
+        ):
+            self._set_refresh_interval(target)
+
+    def _set_refresh_interval(self, interval: int) -> None:
+        """Apply a new change-watch interval to the collector and status bar."""
+        self._effective_interval = interval
+        self.collector.set_change_watch_interval(interval)
+        self._status_bar.set_effective_interval(interval)
+
+    def watch_selected_database(self, db: DatabaseStats | None) -> None:
+        """Push the selected database to the detail panels in one batch.
+
+        BUG FIX: Textual's reactive system uses equality comparison, so if
+        DatabaseStats fields are identical between refreshes, the panels'
+        watchers won't fire. selected_database is always_update, and
+        _push_database renders a panel whose value is unchanged directly.
+        """
+        with self.app.batch_update():
+            self._push_database(self._watcher_panel, db)
+            self._push_database(self._action_panel, db)
+            if self._is_panel_hidden(self._source_files_panel.id):
+                # Skip the filesystem scan until the panel is shown again
+                self._source_files_stale = True
+            else:
+                self._push_database(self._source_files_panel, db)
+
+    @staticmethod
+    def _push_database(panel: WatcherPanel | SourceFilesPanel | ActionPanel, db: DatabaseStats | None) -> None:
+        """Hand db to a detail panel so that it renders exactly once."""
+        if panel.database == db:
+            panel.watch_database(db)  # An equal value would not fire the watcher
+        else:
+            panel.database = db
 
     def on_database_table_database_selected(self, event: DatabaseTable.DatabaseSelected) -> None:
         """Handle database selection."""
-        self._update_panels_for_database(event.database)
+        self.selected_database = event.database
 
     def action_quit(self) -> None:
         """Quit the application."""
         self.app.exit()
 
-    def _get_current_panel_index(self) -> int:
-        """Get index of currently focused panel, or -1 if none."""
+    def _resolve_focused_panel(self) -> tuple[int, str | None]:
+        """Resolve the focused panel as (index, panel_id), or (-1, None) if none."""
         focused = self.focused
         if focused:
-            for idx, panel_id in enumerate(self.PANEL_IDS):
-                try:
-                    panel = self.query_one(f"#{panel_id}")
-                    if focused == panel or focused in panel.query("*"):
-                        return idx
-                except Exception:
-                    pass
-        return -1
+            for node in focused.ancestors_with_self:
+                idx = self._PANEL_ID_TO_IDX.get(node.id)
+                if idx is not None:
+                    return idx, node.id
+        return -1, None
+
+    def _get_current_panel_index(self) -> int:
+        """Get index of currently focused panel, or -1 if none."""
+        return self._resolve_focused_panel()[0]
 
     def action_focus_next_panel(self) -> None:
         """Focus the next panel in order."""
         current_idx = self._get_current_panel_index()
         next_idx = (current_idx + 1) % len(self.PANEL_IDS)
-        try:
-            panel = self.query_one(f"#{self.PANEL_IDS[next_idx]}")
-            panel.focus()
-        except Exception:
-            pass
+        self._panels[self.PANEL_IDS[next_idx]].focus()
 
     def action_focus_prev_panel(self) -> None:
         """Focus the previous panel in order."""
         current_idx = self._get_current_panel_index()
         prev_idx = (current_idx - 1) % len(self.PANEL_IDS)
-        try:
-            panel = self.query_one(f"#{self.PANEL_IDS[prev_idx]}")
-            panel.focus()
-        except Exception:
-            pass
+        self._panels[self.PANEL_IDS[prev_idx]].focus()
 
     def action_new_database(self) -> None:
         """Open new database wizard."""
-        from .wizard import WizardScreen
         self.app.push_screen(WizardScreen())
 
-    def action_start_watcher(self) -> None:
-        """Start watcher for selected database."""
+    def _dispatch_collector_op(self, op_name: str) -> None:
+        """Run a collector operation for the selected database off the UI thread."""
         if not self.selected_database:
             self.notify("Select a database first", severity="warning")
             return
 
-        success, msg = self.collector.start_watcher(self.selected_database.name)
-        if success:
-            self.notify(f"✓ {msg}", severity="information")
-        else:
-            self.notify(f"✗ {msg}", severity="error")
+        self._run_collector_op(op_name, self.selected_database.name)
 
-        self.action_refresh()
+    @work(thread=True, group="collector-ops")
+    def _run_collector_op(self, op_name: str, db_name: str) -> None:
+        """Worker: call a collector operation and report back on the UI thread.
 
-    def action_stop_watcher(self) -> None:
-        """Stop watcher for selected database."""
-        if not self.selected_database:
-            self.notify("Select a database first", severity="warning")
-            return
+        Watcher start/stop and sync may spawn subprocesses or touch disk, so
+        they run in a thread worker to keep the TUI responsive.
+        """
+        try:
+            success, msg = getattr(self.collector, op_name)(db_name)
+            # Re-collect only the affected database, not a full snapshot
+            db = self.collector.get_database(db_name)
+        except Exception as e:
+            success, msg, db = False, str(e), None
+        self.app.call_from_thread(self._after_collector_op, success, msg, db)
 
-        success, msg = self.collector.stop_watcher(self.selected_database.name)
+    def _notify_result(self, success: bool, msg: str) -> None:
+        """Show a ✓/✗ notification for an operation result."""
         if success:
-            self.notify(f"✓ {msg}", severity="information")
+            self.notify(self._SUCCESS_PREFIX + msg, severity="information")
         else:
-            self.notify(f"✗ {msg}", severity="error")
+            self.notify(self._FAILURE_PREFIX + msg, severity="error")
 
-        self.action_refresh()
+    def _after_collector_op(self, success: bool, msg: str, db: DatabaseStats | None) -> None:
+        """Notify the result of a collector operation and update that database.
 
-    def action_toggle_auto_watch(self) -> None:
-        """Toggle auto-watch for selected database."""
-        if not self.selected_database:
-            self.notify("Select a database first", severity="warning")
+        The last applied snapshot is patched with the re-collected database
+        and re-applied, so the table row, panels and status bar totals all
+        reflect it and later snapshots diff against it. The collector's change
+        watch still pushes a full snapshot (logs) once files change on disk.
+        """
+        self._notify_result(success, msg)
+
+        if db is None or self._last_applied is None:
             return
 
-        success, msg = self.collector.toggle_auto_watch(self.selected_database.name)
-        if success:
-            self.notify(f"✓ {msg}", severity="information")
-        else:
-            self.notify(f"✗ {msg}", severity="error")
+        # The table re-posts DatabaseSelected, which refreshes the panels
+        last = self._last_applied
+        databases = [db if d.name == db.name else d for d in last.databases]
+        self._apply_snapshot(build_snapshot(databases, last.recent_logs), record_cost=False)
 
-        self.action_refresh()
+    def action_start_watcher(self) -> None:
+        """Start watcher for selected database."""
+        self._dispatch_collector_op("start_watcher")
 
-    def action_force_sync(self) -> None:
-        """Force sync for selected database."""
-        if not self.selected_database:
-            self.notify("Select a database first", severity="warning")
-            return
+    def action_stop_watcher(self) -> None:
+        """Stop watcher for selected database."""
+        self._dispatch_collector_op("stop_watcher")
 
-        success, msg = self.collector.force_sync(self.selected_database.name)
-        if success:
-            self.notify(f"✓ {msg}", severity="information")
-        else:
-            self.notify(f"✗ {msg}", severity="error")
+    def action_toggle_auto_watch(self) -> None:
+        """Toggle auto-watch for selected database."""
+        self._dispatch_collector_op("toggle_auto_watch")
 
-        self.action_refresh()
+    def action_force_sync(self) -> None:
+        """Force sync for selected database."""
+        self._dispatch_collector_op("force_sync")
 
     def action_toggle_log_scope(self) -> None:
         """Toggle between all logs and selected database logs."""
-        log = self.query_one("#activity-log", ActivityLog)
+        log = self._activity_log
 
         if log.show_all:
             # Switch to filtered
@@ -509,43 +608,17 @@ class DashboardScreen(Screen):
 
         db = self.selected_database
 
-        # BUG-007 fix: Show symlink targets for path display
-        def format_path(path: str | None) -> str:
-            if not path:
-                return "N/A"
-            p = Path(path)
-            if p.is_symlink():
-                try:
-                    target = p.resolve()
-                    return f"{path} → {target}"
-                except (OSError, RuntimeError):
-                    return f"{path} [symlink]"
-            return path
-
-        info_lines = [
-            f"[bold]Database: {db.name}[/bold]",
-            f"Path: {format_path(db.path)}",
-            f"Source: {format_path(db.source_folder)}",
-            f"Type: {db.source_type}",
-            f"Size: {db.total_size_human}",
-            f"Entities: {db.entity_count:,}",
-            f"Relations: {db.relation_count:,}",
-            f"Chunks: {db.chunk_count:,}",
-            f"Last Sync: {db.last_sync_human}",
-            f"Auto-watch: {'Yes' if db.auto_watch else 'No'}",
-            f"Model: {db.model or 'default'}",
-        ]
-
-        if db.errors:
-            info_lines.append("\n[red]Errors:[/red]")
-            for err in db.errors:
-                info_lines.append(f"  - {err}")
-
-        self.notify("\n".join(info_lines), title=f"Database: {db.name}")
+        text = _format_info(
+            db.name, db.path, db.source_folder, db.source_type,
+            db.total_size_human, db.entity_count, db.relation_count,
+            db.chunk_count, db.last_sync_human, db.auto_watch, db.model,
+            tuple(db.errors),
+        )
+        self.notify(text, title=f"Database: {db.name}")
 
     def action_toggle_history(self) -> None:
         """Toggle history panel filter for selected database."""
-        history = self.query_one("#history-panel", HistoryPanel)
+        history = self._history_panel
 
         if history.filter_database:
             # Switch to all databases
@@ -561,38 +634,15 @@ class DashboardScreen(Screen):
 
     def _get_focused_panel_id(self) -> str | None:
         """Get the ID of the currently focused panel."""
-        focused = self.focused
-        if focused:
-            for panel_id in self.PANEL_IDS:
-                try:
-                    panel = self.query_one(f"#{panel_id}")
-                    if focused == panel or focused in panel.query("*"):
-                        return panel_id
-                except Exception:
-                    pass
-        return None
+        return self._resolve_focused_panel()[1]
 
     def _get_panel_section_id(self, panel_id: str) -> str | None:
         """Get the main section ID for a panel."""
-        section_map = {
-            "history-panel": "timeline-section",
-            "database-table": "database-section",
-            "watcher-panel": "watcher-actions-row",
-            "action-panel": "watcher-actions-row",
-            "source-files-panel": "bottom-row",
-            "activity-log": "bottom-row",
-        }
-        return section_map.get(panel_id)
+        return self._PANEL_SECTION_MAP.get(panel_id)
 
     def _get_panel_cell_id(self, panel_id: str) -> str | None:
         """Get the cell ID for panels in split rows."""
-        cell_map = {
-            "watcher-panel": "watcher-cell",
-            "action-panel": "action-cell",
-            "source-files-panel": "source-files-cell",
-            "activity-log": "activity-log-cell",
-        }
-        return cell_map.get(panel_id)
+        return self._PANEL_CELL_MAP.get(panel_id)
 
     def action_toggle_maximize(self) -> None:
         """Toggle maximize for the currently focused panel."""
@@ -614,50 +664,26 @@ class DashboardScreen(Screen):
         panel_section = self._get_panel_section_id(panel_id)
         panel_cell = self._get_panel_cell_id(panel_id)
 
-        # All main sections (rows in the grid)
-        all_sections = ["timeline-section", "database-section", "watcher-actions-row", "bottom-row"]
+        nodes = self._layout_nodes
+        with self.app.batch_update():
+            # Hide all sections except the one containing our panel
+            for section_id in self._ALL_SECTIONS:
+                if section_id != panel_section:
+                    nodes[section_id].styles.display = "none"
 
-        # Hide all sections except the one containing our panel
-        for section_id in all_sections:
-            if section_id != panel_section:
-                try:
-                    section = self.query_one(f"#{section_id}")
-                    section.styles.display = "none"
-                except Exception:
-                    pass
+            # KEY FIX: Change the screen's grid-rows to collapse hidden rows
+            # Normal: auto 12 10 12 1fr auto auto (header, timeline, db, watcher, bottom, status, footer)
+            # Maximized: auto 1fr auto auto (header, maximized-section, status, footer)
+            self.styles.grid_rows = "auto 1fr auto auto"
 
-        # KEY FIX: Change the screen's grid-rows to collapse hidden rows
-        # Normal: auto 12 10 12 1fr auto auto (header, timeline, db, watcher, bottom, status, footer)
-        # Maximized: auto 1fr auto auto (header, maximized-section, status, footer)
-        self.styles.grid_rows = "auto 1fr auto auto"
-
-        # Make the visible section expand to fill available space
-        try:
-            section = self.query_one(f"#{panel_section}")
+            # Make the visible section expand to fill available space
+            section = nodes[panel_section]
             section.styles.height = "100%"
-        except Exception:
-            pass
-
-        # If panel is in a split row, hide sibling and expand this cell
-        if panel_cell:
-            sibling_cells = {
-                "watcher-cell": "action-cell",
-                "action-cell": "watcher-cell",
-                "source-files-cell": "activity-log-cell",
-                "activity-log-cell": "source-files-cell",
-            }
-            sibling = sibling_cells.get(panel_cell)
-            if sibling:
-                try:
-                    self.query_one(f"#{sibling}").styles.display = "none"
-                except Exception:
-                    pass
-            # Make the row use single column
-            try:
-                row = self.query_one(f"#{panel_section}")
-                row.styles.grid_size_columns = 1
-            except Exception:
-                pass
+
+            # If panel is in a split row, hide sibling and make the row single column
+            if panel_cell:
+                nodes[self._SIBLING_CELLS[panel_cell]].styles.display = "none"
+                section.styles.grid_size_columns = 1
 
         self.notify(f"Maximized: {panel_id} (press 'm' or Escape to restore)")
 
@@ -669,35 +695,26 @@ class DashboardScreen(Screen):
         self.maximized_panel = None
         self.remove_class("maximized-mode")
 
-        # KEY FIX: Restore the screen's grid-rows to original value
-        # Normal: auto 12 10 12 1fr auto auto (header, timeline, db, watcher, bottom, status, footer)
-        self.styles.grid_rows = "auto 12 10 12 1fr auto auto"
+        nodes = self._layout_nodes
+        with self.app.batch_update():
+            # KEY FIX: Restore the screen's grid-rows to original value
+            # Normal: auto 12 10 12 1fr auto auto (header, timeline, db, watcher, bottom, status, footer)
+            self.styles.grid_rows = "auto 12 10 12 1fr auto auto"
 
-        # Restore all sections - show them and reset height
-        sections = ["timeline-section", "database-section", "watcher-actions-row", "bottom-row"]
-        for section_id in sections:
-            try:
-                section = self.query_one(f"#{section_id}")
+            # Restore all sections - show them and reset height
+            for section_id in self._ALL_SECTIONS:
+                section = nodes[section_id]
                 section.styles.display = "block"
                 section.styles.height = "100%"
-            except Exception:
-                pass
-
-        # Restore all cells - show them
-        cells = ["watcher-cell", "action-cell", "source-files-cell", "activity-log-cell"]
-        for cell_id in cells:
-            try:
-                cell = self.query_one(f"#{cell_id}")
-                cell.styles.display = "block"
-            except Exception:
-                pass
-
-        # Restore grid columns for split rows
-        for row_id in ["watcher-actions-row", "bottom-row"]:
-            try:
-                row = self.query_one(f"#{row_id}")
-                row.styles.grid_size_columns = 2
-            except Exception:
-                pass
+
+            # Restore all cells - show them
+            for cell_id in self._SPLIT_CELLS:
+                nodes[cell_id].styles.display = "block"
+
+            # Restore grid columns for split rows
+            for row_id in self._SPLIT_ROWS:
+                nodes[row_id].styles.grid_size_columns = 2
+
+            self._flush_deferred_panels()
 
         self.notify("Layout restored")
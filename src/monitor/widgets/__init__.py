@@ -1,21 +1,34 @@
 """
 Monitor widget components.
+
+Widgets are imported on first access (PEP 562), so importing one widget
+module doesn't pull in all the others.
 """
 
-from .database_table import DatabaseTable
-from .watcher_panel import WatcherPanel
-from .activity_log import ActivityLog
-from .action_panel import ActionPanel
-from .status_bar import StatusBar
-from .history_panel import HistoryPanel
-from .source_files_panel import SourceFilesPanel
-
-__all__ = [
-    'DatabaseTable',
-    'WatcherPanel',
-    'ActivityLog',
-    'ActionPanel',
-    'StatusBar',
-    'HistoryPanel',
-    'SourceFilesPanel'
-]
+from importlib import import_module
+
+# Exported widget -> submodule defining it
+_WIDGET_MODULES = {
+    'DatabaseTable': 'database_table',
+    'WatcherPanel': 'watcher_panel',
+    'ActivityLog': 'activity_log',
+    'ActionPanel': 'action_panel',
+    'StatusBar': 'status_bar',
+    'HistoryPanel': 'history_panel',
+    'SourceFilesPanel': 'source_files_panel',
+}
+
+__all__ = list(_WIDGET_MODULES)
+
+
+def __getattr__(name: str):
+    module_name = _WIDGET_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    widget = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = widget  # Later lookups bypass __getattr__
+    return widget
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -5,6 +5,8 @@ Action Panel Widget
 Shows available keyboard shortcuts and actions.
 """
 
+from functools import lru_cache
+
 from textual.widgets import Static
 from textual.reactive import reactive
 from rich.panel import Panel
@@ -28,57 +30,75 @@ class ActionPanel(Static, can_focus=True):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        self._shown_panel: Panel | None = None  # Cached panel currently displayed
 
-    def _render_actions(self, db: DatabaseStats | None) -> Panel:
-        """Render available actions."""
-        table = Table.grid(padding=(0, 1))
-        table.add_column(style="bold yellow", width=4)
-        table.add_column()
-
-        # Database management actions
-        table.add_row("[n]", "New database (wizard)")
-        if db:
-            table.add_row("[e]", "Edit settings")
-            table.add_row("[d]", "Delete database")
-            table.add_row("─", "─" * 22)
-
-            # Watcher actions
-            if db.watcher_running:
-                table.add_row("[x]", Text("Stop watcher", style="red"))
-            else:
-                table.add_row("[s]", Text("Start watcher", style="green"))
-
-            table.add_row("[y]", "Force sync")
-
-            if db.auto_watch:
-                table.add_row("[a]", "Disable auto-watch")
-            else:
-                table.add_row("[a]", "Enable auto-watch")
-
-            table.add_row("─", "─" * 22)
-            table.add_row("[l]", "View logs")
-            table.add_row("[t]", "Toggle log scope")
-            table.add_row("[i]", "Database info")
-        else:
-            table.add_row("", "")
-            table.add_row("", Text("Select a database", style="dim italic"))
-            table.add_row("", Text("to see more actions", style="dim italic"))
+    @staticmethod
+    def _action_state(db: DatabaseStats | None) -> tuple[bool, bool] | None:
+        """The database fields the action list depends on."""
+        if db is None:
+            return None
+        return (db.watcher_running, db.auto_watch)
 
-        table.add_row("─", "─" * 22)
-        table.add_row("[r]", "Refresh")
-        table.add_row("[q]", "Quit")
-
-        return Panel(
-            table,
-            title="Actions",
-            border_style="dim",
-            box=SIMPLE
-        )
+    def _render_actions(self, db: DatabaseStats | None) -> Panel:
+        """Render available actions (one shared Panel per action state)."""
+        return _build_actions_panel(self._action_state(db))
 
     def watch_database(self, database: DatabaseStats | None) -> None:
         """Called when database reactive changes."""
-        self.update(self._render_actions(database))
+        panel = self._render_actions(database)
+        if panel is not self._shown_panel:
+            self._shown_panel = panel
+            self.update(panel)
 
     def on_mount(self) -> None:
         """Initialize with default actions."""
-        self.update(self._render_actions(None))
+        self.watch_database(None)
+
+
+@lru_cache(maxsize=8)
+def _build_actions_panel(state: tuple[bool, bool] | None) -> Panel:
+    """Build the actions panel for (watcher_running, auto_watch), or None for no selection."""
+    table = Table.grid(padding=(0, 1))
+    table.add_column(style="bold yellow", width=4)
+    table.add_column()
+
+    # Database management actions
+    table.add_row("[n]", "New database (wizard)")
+    if state is not None:
+        watcher_running, auto_watch = state
+        table.add_row("[e]", "Edit settings")
+        table.add_row("[d]", "Delete database")
+        table.add_row("─", "─" * 22)
+
+        # Watcher actions
+        if watcher_running:
+            table.add_row("[x]", Text("Stop watcher", style="red"))
+        else:
+            table.add_row("[s]", Text("Start watcher", style="green"))
+
+        table.add_row("[y]", "Force sync")
+
+        if auto_watch:
+            table.add_row("[a]", "Disable auto-watch")
+        else:
+            table.add_row("[a]", "Enable auto-watch")
+
+        table.add_row("─", "─" * 22)
+        table.add_row("[l]", "View logs")
+        table.add_row("[t]", "Toggle log scope")
+        table.add_row("[i]", "Database info")
+    else:
+        table.add_row("", "")
+        table.add_row("", Text("Select a database", style="dim italic"))
+        table.add_row("", Text("to see more actions", style="dim italic"))
+
+    table.add_row("─", "─" * 22)
+    table.add_row("[r]", "Refresh")
+    table.add_row("[q]", "Quit")
+
+    return Panel(
+        table,
+        title="Actions",
+        border_style="dim",
+        box=SIMPLE
+    )
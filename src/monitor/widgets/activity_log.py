@@ -5,6 +5,9 @@ Activity Log Widget
 Real-time scrolling log viewer for ingestion/watcher activity.
 """
 
+from collections import deque
+
+from textual import events
 from textual.widgets import RichLog
 from textual.reactive import reactive
 from rich.text import Text
@@ -26,6 +29,12 @@ class ActivityLog(RichLog):
     filter_database: reactive[str | None] = reactive(None)
     show_all: reactive[bool] = reactive(True)
 
+    # Cap on retained entries, matching the RichLog line cap
+    MAX_ENTRIES = 500
+
+    # Extra entries rendered beyond the visible rows so short scrolls stay populated
+    OVERSCAN = 32
+
     LEVEL_STYLES = {
         "INFO": "white",
         "SUCCESS": "green",
@@ -40,10 +49,46 @@ class ActivityLog(RichLog):
             markup=True,
             wrap=True,
             auto_scroll=True,
-            max_lines=500,
+            max_lines=self.MAX_ENTRIES,
             **kwargs
         )
-        self._entries: list[LogEntry] = []
+        self._entries: deque[LogEntry] = deque(maxlen=self.MAX_ENTRIES)
+        # id(entry) -> (entry, line, detail line); rendered lazily, reused across refreshes
+        self._rendered: dict[int, tuple[LogEntry, Text, Text | None]] = {}
+        self._window = 0  # Newest matching entries rendered; grows as the user scrolls up
+        self._has_older = False  # Matching entries older than the window are held
+        self._older_pending = False  # A _show_older call is scheduled
+
+    @property
+    def visible_capacity(self) -> int:
+        """Number of entries worth rendering: visible rows plus overscan."""
+        return self.size.height + self.OVERSCAN
+
+    def on_resize(self, event: events.Resize) -> None:
+        """Re-render when the window no longer fills the view."""
+        if self._has_older and self.visible_capacity > self._window:
+            self.refresh_view()
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        """Render older entries once the user scrolls up near the top."""
+        super().watch_scroll_y(old_value, new_value)
+        if (
+            self._has_older
+            and not self._older_pending
+            and new_value < old_value
+            and new_value < self.size.height
+        ):
+            self._older_pending = True
+            self.call_after_refresh(self._show_older)
+
+    def _show_older(self) -> None:
+        """Double the window, keeping the lines in view where they are."""
+        if self._has_older:
+            lines_before = len(self.lines)
+            scroll_y = self.scroll_y
+            self._render_window(min(2 * self._window, self.MAX_ENTRIES), scroll_end=False)
+            self.scroll_to(y=scroll_y + len(self.lines) - lines_before, animate=False)
+        self._older_pending = False
 
     def on_mount(self) -> None:
         """Initialize log."""
@@ -51,67 +96,107 @@ class ActivityLog(RichLog):
 
     def add_entry(self, entry: LogEntry) -> None:
         """Add a single log entry."""
+        if len(self._entries) == self.MAX_ENTRIES:
+            # The oldest entry is about to drop out; forget its rendering too
+            self._rendered.pop(id(self._entries[0]), None)
         self._entries.append(entry)
-        self._render_entry(entry)
+        if self._is_visible(entry):
+            self._write_rendered(self._rendered_for(entry))
 
-    def _render_entry(self, entry: LogEntry) -> None:
-        """Render a log entry to the log view."""
-        # Check filter
-        if not self.show_all and self.filter_database:
-            if entry.database != self.filter_database:
-                return
+    def _is_visible(self, entry: LogEntry) -> bool:
+        """Check an entry against the current filter."""
+        if self.show_all or not self.filter_database:
+            return True
+        return entry.database == self.filter_database
 
-        style = self.LEVEL_STYLES.get(entry.level, "white")
+    def _render_entry(self, entry: LogEntry) -> tuple[Text, Text | None]:
+        """Build the log line and, for long errors, a detail line."""
+        style = self.LEVEL_STYLES.get(entry.level) or "white"
 
-        # Format timestamp
-        timestamp = entry.timestamp.strftime("%H:%M:%S")
+        # Format timestamp (direct field formatting; strftime re-parses its format)
+        ts = entry.timestamp
+        timestamp = f"{ts.hour:02d}:{ts.minute:02d}:{ts.second:02d}"
 
         # Build the log line
         line = Text()
         line.append(f"[{timestamp}] ", style="dim")
         line.append(f"{entry.database}: ", style="cyan bold")
+        line.append(entry.message, style=style)
 
         # For errors, show full message with wrapping for debugging
-        if entry.level == "ERROR":
-            line.append(entry.message, style=style)
-            self.write(line)
+        detail_line = None
+        raw = entry.raw
+        if entry.level == "ERROR" and len(raw) > 80 and "/" in raw:
             # If there's a path in the raw message, show it on next line
-            if "/" in entry.raw and len(entry.raw) > 80:
-                detail_line = Text()
-                detail_line.append("           └─ ", style="dim")
-                detail_line.append(entry.raw[-100:] if len(entry.raw) > 100 else entry.raw, style="dim red")
-                self.write(detail_line)
-        else:
-            line.append(entry.message, style=style)
-            self.write(line)
+            detail_line = Text()
+            detail_line.append("           └─ ", style="dim")
+            detail_line.append(raw[-100:], style="dim red")
+
+        return line, detail_line
+
+    def _rendered_for(self, entry: LogEntry) -> tuple[LogEntry, Text, Text | None]:
+        """Rendered lines for an entry, from cache when already formatted."""
+        rendered = self._rendered.get(id(entry))
+        if rendered is None or rendered[0] is not entry:
+            rendered = (entry, *self._render_entry(entry))
+            self._rendered[id(entry)] = rendered
+        return rendered
+
+    def _write_rendered(
+        self, rendered: tuple[LogEntry, Text, Text | None], scroll_end: bool | None = None
+    ) -> None:
+        """Write a rendered entry to the log view."""
+        _, line, detail_line = rendered
+        self.write(line, scroll_end=scroll_end)
+        if detail_line is not None:
+            self.write(detail_line, scroll_end=scroll_end)
 
     def update_entries(self, entries: list[LogEntry]) -> None:
-        """Update with a list of log entries."""
-        self._entries = entries
+        """Update with a list of log entries (keeps the last MAX_ENTRIES)."""
+        self._entries = deque(entries[-self.MAX_ENTRIES:], maxlen=self.MAX_ENTRIES)
+        # Keep rendered lines only for entries still held
+        rendered = self._rendered
+        self._rendered = {
+            id(entry): rendered[id(entry)]
+            for entry in self._entries
+            if id(entry) in rendered and rendered[id(entry)][0] is entry
+        }
         self.refresh_view()
 
     def refresh_view(self) -> None:
-        """Refresh the log view with current entries and filters."""
+        """Refresh the log view with current entries and filters.
+
+        Only a window of the newest entries that pass the filter is rendered,
+        at least visible_capacity of them. Scrolling up near the top doubles
+        the window, so all MAX_ENTRIES held entries stay reachable.
+        """
+        self._render_window(max(self._window, self.visible_capacity))
+
+    def _render_window(self, window: int, scroll_end: bool | None = None) -> None:
+        """Re-render the newest window entries that pass the filter."""
         self.clear()
+        self._window = window
 
-        # Filter entries
-        if self.show_all:
-            visible = self._entries
-        elif self.filter_database:
-            visible = [e for e in self._entries if e.database == self.filter_database]
-        else:
-            visible = self._entries
+        shown: list[LogEntry] = []
+        self._has_older = False
+        for entry in reversed(self._entries):
+            if self._is_visible(entry):
+                if len(shown) >= window:
+                    self._has_older = True
+                    break
+                shown.append(entry)
 
-        # Render all visible entries
-        for entry in visible:
-            self._render_entry(entry)
+        for entry in reversed(shown):
+            self._write_rendered(self._rendered_for(entry), scroll_end)
 
     def watch_filter_database(self, old_value: str | None, new_value: str | None) -> None:
         """Called when filter changes."""
+        self._window = 0
         self.refresh_view()
 
     def watch_show_all(self, old_value: bool, new_value: bool) -> None:
         """Called when show_all changes."""
+        self._window = 0
         self.refresh_view()
 
     def toggle_view(self) -> None:
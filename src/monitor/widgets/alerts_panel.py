@@ -5,17 +5,47 @@ Alerts Panel Widget
 Displays system alerts with severity indicators and acknowledgement controls.
 """
 
+import heapq
 from datetime import datetime
 from textual.app import ComposeResult
 from textual.containers import Vertical, Horizontal
 from textual.widgets import Static, Button, DataTable
 from textual.reactive import reactive
-from rich.text import Text
+from textual.message import Message
+from rich.markup import escape
 from rich.panel import Panel
 from rich.table import Table
 
 from src.alerting import get_alert_manager, Alert, AlertSeverity
 
+# Seconds between checks of the alerts file for alerts written by watchers
+# (a stat(); widgets only re-render when the alert set actually changed)
+ALERTS_CHECK_INTERVAL = 10
+
+# Sort order, icon and markup style per severity
+_SEVERITY_ORDER = {
+    AlertSeverity.CRITICAL: 0,
+    AlertSeverity.ERROR: 1,
+    AlertSeverity.WARNING: 2,
+    AlertSeverity.INFO: 3,
+}
+_SEVERITY_ICONS = {
+    AlertSeverity.CRITICAL: "🔴",
+    AlertSeverity.ERROR: "🟠",
+    AlertSeverity.WARNING: "🟡",
+    AlertSeverity.INFO: "🔵",
+}
+_SEVERITY_STYLES = {
+    AlertSeverity.CRITICAL: "bold red",
+    AlertSeverity.ERROR: "bold yellow",
+    AlertSeverity.WARNING: "yellow",
+    AlertSeverity.INFO: "blue",
+}
+
+
+class AlertsChanged(Message, bubble=False):
+    """Posted to an alert widget when the alert set changed."""
+
 
 class AlertsPanel(Static):
     """Panel displaying system alerts."""
@@ -65,10 +95,13 @@ class AlertsPanel(Static):
 
     alerts_count = reactive(0)
 
+    MAX_SHOWN = 20  # Alerts listed; the rest are summarized in one line
+
     def __init__(self, database: str = None, **kwargs):
         super().__init__(**kwargs)
         self.database = database
         self.alert_manager = get_alert_manager()
+        self._fingerprint: tuple | None = None  # Summary and alert ids last rendered
 
     def compose(self) -> ComposeResult:
         with Vertical():
@@ -79,18 +112,30 @@ class AlertsPanel(Static):
             yield Static(id="alerts-content", classes="alerts-content")
 
     def on_mount(self) -> None:
-        """Load alerts on mount."""
+        """Load alerts on mount and refresh whenever they change."""
+        self.refresh_alerts()
+        self.alert_manager.add_listener(self._alerts_changed_callback)
+        self.set_interval(ALERTS_CHECK_INTERVAL, self.alert_manager.check_for_changes)
+
+    def on_unmount(self) -> None:
+        """Stop alert change notifications."""
+        self.alert_manager.remove_listener(self._alerts_changed_callback)
+
+    def _alerts_changed_callback(self) -> None:
+        """Alert manager callback (any thread): refresh via the message queue."""
+        self.post_message(AlertsChanged())
+
+    def on_alerts_changed(self, message: AlertsChanged) -> None:
         self.refresh_alerts()
-        # Auto-refresh every 30 seconds
-        self.set_interval(30, self.refresh_alerts)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         if event.button.id == "ack-all-btn":
+            # The alert manager notifies listeners, which refreshes the panel
             self.alert_manager.acknowledge_all(self.database)
-            self.refresh_alerts()
         elif event.button.id == "refresh-alerts-btn":
-            self.refresh_alerts()
+            if not self.alert_manager.check_for_changes():
+                self.refresh_alerts()
 
     def refresh_alerts(self) -> None:
         """Refresh the alerts display."""
@@ -99,11 +144,15 @@ class AlertsPanel(Static):
             include_acknowledged=False
         )
         self.alerts_count = len(alerts)
-
-        # Update title with count
-        title = self.query_one("#alerts-title", Static)
         summary = self.alert_manager.get_summary()
 
+        # Skip the rebuild when neither the counts nor the shown alerts changed
+        fingerprint = (tuple(summary.values()), tuple(a.id for a in alerts))
+        if fingerprint == self._fingerprint:
+            return
+        self._fingerprint = fingerprint
+
+        # Title with per-severity counts
         severity_icons = []
         if summary["critical"] > 0:
             severity_icons.append(f"🔴 {summary['critical']}")
@@ -115,64 +164,52 @@ class AlertsPanel(Static):
             severity_icons.append(f"🔵 {summary['info']}")
 
         if severity_icons:
-            title.update(f"⚠️ Alerts ({' '.join(severity_icons)})")
+            title_text = f"⚠️ Alerts ({' '.join(severity_icons)})"
         else:
-            title.update("✅ No Alerts")
+            title_text = "✅ No Alerts"
+
+        panel = self._render_alerts(alerts)
 
-        # Build alerts display
-        content = self.query_one("#alerts-content", Static)
+        # Title and content repaint as one frame
+        with self.app.batch_update():
+            self.query_one("#alerts-title", Static).update(title_text)
+            self.query_one("#alerts-content", Static).update(panel)
 
+    def _render_alerts(self, alerts: list[Alert]) -> Panel:
+        """Build the alerts display."""
         if not alerts:
-            content.update(Panel(
+            return Panel(
                 "[green]No active alerts[/green]\n\nAll systems operating normally.",
                 title="Status",
                 border_style="green"
-            ))
-            return
+            )
 
-        # Sort by severity (critical first) then by timestamp (newest first)
-        severity_order = {
-            AlertSeverity.CRITICAL: 0,
-            AlertSeverity.ERROR: 1,
-            AlertSeverity.WARNING: 2,
-            AlertSeverity.INFO: 3,
-        }
-        alerts.sort(key=lambda a: (severity_order.get(a.severity, 99), -a.timestamp.timestamp()))
+        # Most severe first, then newest first; only the shown alerts are ordered
+        shown = heapq.nsmallest(
+            self.MAX_SHOWN, alerts,
+            key=lambda a: (_SEVERITY_ORDER.get(a.severity, 99), -a.timestamp.timestamp()),
+        )
 
-        # Build rich text for each alert
+        # One markup line per alert; database and message are escaped so
+        # brackets in them aren't read as markup tags
         lines = []
-        for alert in alerts[:20]:  # Show max 20 alerts
-            severity_icon = {
-                AlertSeverity.CRITICAL: "🔴",
-                AlertSeverity.ERROR: "🟠",
-                AlertSeverity.WARNING: "🟡",
-                AlertSeverity.INFO: "🔵",
-            }.get(alert.severity, "⚪")
-
-            severity_style = {
-                AlertSeverity.CRITICAL: "bold red",
-                AlertSeverity.ERROR: "bold yellow",
-                AlertSeverity.WARNING: "yellow",
-                AlertSeverity.INFO: "blue",
-            }.get(alert.severity, "white")
-
+        for alert in shown:
+            icon = _SEVERITY_ICONS.get(alert.severity, "⚪")
+            style = _SEVERITY_STYLES.get(alert.severity, "white")
             time_str = alert.timestamp.strftime("%H:%M:%S")
+            lines.append(
+                f"[{style}]{icon}[/] [dim]\\[{time_str}][/] "
+                f"[cyan]\\[{escape(alert.database)}][/] [{style}]{escape(alert.message)}[/]"
+            )
 
-            line = Text()
-            line.append(f"{severity_icon} ", style=severity_style)
-            line.append(f"[{time_str}] ", style="dim")
-            line.append(f"[{alert.database}] ", style="cyan")
-            line.append(alert.message, style=severity_style)
-            lines.append(line)
+        if len(alerts) > self.MAX_SHOWN:
+            lines.append(f"\n[dim]... and {len(alerts) - self.MAX_SHOWN} more alerts[/dim]")
 
-        if len(alerts) > 20:
-            lines.append(Text(f"\n... and {len(alerts) - 20} more alerts", style="dim"))
-
-        content.update(Panel(
-            "\n".join(str(line) for line in lines),
+        return Panel(
+            "\n".join(lines),
             title=f"Active Alerts ({len(alerts)})",
             border_style="yellow"
-        ))
+        )
 
     def set_database(self, database: str) -> None:
         """Set the database filter and refresh."""
@@ -186,26 +223,41 @@ class AlertsSummaryWidget(Static):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.alert_manager = get_alert_manager()
+        self._text: str | None = None  # Summary text last shown
 
     def on_mount(self) -> None:
-        """Start refresh timer."""
+        """Show the summary after the initial paint, then refresh it on alert changes."""
+        self.call_after_refresh(self.refresh_summary)
+        self.alert_manager.add_listener(self._alerts_changed_callback)
+        self.set_interval(ALERTS_CHECK_INTERVAL, self.alert_manager.check_for_changes)
+
+    def on_unmount(self) -> None:
+        """Stop alert change notifications."""
+        self.alert_manager.remove_listener(self._alerts_changed_callback)
+
+    def _alerts_changed_callback(self) -> None:
+        """Alert manager callback (any thread): refresh via the message queue."""
+        self.post_message(AlertsChanged())
+
+    def on_alerts_changed(self, message: AlertsChanged) -> None:
         self.refresh_summary()
-        self.set_interval(10, self.refresh_summary)
 
     def refresh_summary(self) -> None:
         """Update the summary display."""
         summary = self.alert_manager.get_summary()
 
         if summary["total"] == 0:
-            self.update("✅")
-            return
-
-        parts = []
-        if summary["critical"] > 0:
-            parts.append(f"🔴{summary['critical']}")
-        if summary["error"] > 0:
-            parts.append(f"🟠{summary['error']}")
-        if summary["warning"] > 0:
-            parts.append(f"🟡{summary['warning']}")
-
-        self.update(" ".join(parts) if parts else f"🔵{summary['info']}")
+            text = "✅"
+        else:
+            parts = []
+            if summary["critical"] > 0:
+                parts.append(f"🔴{summary['critical']}")
+            if summary["error"] > 0:
+                parts.append(f"🟠{summary['error']}")
+            if summary["warning"] > 0:
+                parts.append(f"🟡{summary['warning']}")
+            text = " ".join(parts) if parts else f"🔵{summary['info']}"
+
+        if text != self._text:
+            self._text = text
+            self.update(text)
@@ -7,6 +7,7 @@ DataTable widget showing all registered databases with their stats.
 
 from textual.widgets import DataTable
 from textual.binding import Binding
+from textual.coordinate import Coordinate
 from textual.message import Message
 from rich.text import Text
 
@@ -39,6 +40,9 @@ class DatabaseTable(DataTable):
             self.database = database
             super().__init__()
 
+    # Column keys, in the order _row_cells returns the cells
+    COLUMN_KEYS = ("name", "status", "size", "entities", "relations", "sync", "watcher")
+
     def __init__(self, **kwargs):
         super().__init__(
             cursor_type="row",
@@ -46,6 +50,52 @@ class DatabaseTable(DataTable):
             **kwargs
         )
         self._databases: dict[str, DatabaseStats] = {}
+        self._row_fields: dict[str, tuple] = {}  # Row key -> rendered fields, in row order
+        self._selection_pending = False  # A DatabaseSelected post is scheduled
+
+    @staticmethod
+    def _fields(db: DatabaseStats) -> tuple:
+        """The fields rendered in a database's row."""
+        return (
+            db.name, db.exists, db.healthy, db.total_size_human,
+            db.entity_count, db.relation_count, db.last_sync_human,
+            db.watcher_running, db.watcher_pid, db.auto_watch,
+        )
+
+    @staticmethod
+    def _row_cells(db: DatabaseStats) -> tuple:
+        """Cell values for a database's row, in COLUMN_KEYS order."""
+        # Status icon
+        if not db.exists:
+            status = Text("🔴 GONE", style="red")
+        elif not db.healthy:
+            status = Text("⚠️ ERR", style="yellow")
+        elif db.watcher_running:
+            status = Text("🟢 UP", style="green")
+        else:
+            status = Text("⚪ --", style="dim")
+
+        # Watcher column
+        if db.watcher_running:
+            watcher = Text(f"🟢 {db.watcher_pid}", style="green")
+        elif db.auto_watch:
+            watcher = Text("⏸ auto", style="yellow")
+        else:
+            watcher = Text("⚪ off", style="dim")
+
+        # Format numbers
+        entities = f"{db.entity_count:,}" if db.entity_count else "-"
+        relations = f"{db.relation_count:,}" if db.relation_count else "-"
+
+        return (
+            db.name,
+            status,
+            db.total_size_human,
+            entities,
+            relations,
+            db.last_sync_human,
+            watcher,
+        )
 
     def on_mount(self) -> None:
         """Set up table columns."""
@@ -57,83 +107,79 @@ class DatabaseTable(DataTable):
         self.add_column("Last Sync", key="sync", width=14)
         self.add_column("Watcher", key="watcher", width=12)
 
+    def _cursor_key(self) -> str | None:
+        """Row key (database name) under the cursor."""
+        if self.row_count == 0:
+            return None
+        return self.coordinate_to_cell_key(Coordinate(self.cursor_row, 0)).row_key.value
+
+    def _schedule_selection(self) -> None:
+        """Post DatabaseSelected for the cursor row once the current frame is done.
+
+        Holding an arrow key or a table update that moves the cursor would
+        otherwise post one message per step.
+        """
+        if not self._selection_pending:
+            self._selection_pending = True
+            self.call_after_refresh(self._post_selection)
+
+    def _post_selection(self) -> None:
+        self._selection_pending = False
+        db = self.get_selected_database()
+        if db:
+            self.post_message(self.DatabaseSelected(db))
+
     def update_databases(self, databases: list[DatabaseStats]) -> None:
         """Update table with new database stats."""
-        # Remember currently selected database before clearing
-        selected_db_name = None
-        if self.cursor_row is not None and self.row_count > 0:
-            try:
-                row_key = self.get_row_at(self.cursor_row)
-                if row_key:
-                    selected_db_name = row_key.value
-            except Exception:
-                pass
-
-        # Store for later access
+        # The stats objects are always replaced so selection lookups return fresh data
         self._databases = {db.name: db for db in databases}
 
-        # Clear and repopulate
-        self.clear()
-
-        selected_row_index = None
-        for idx, db in enumerate(databases):
-            # Status icon
-            if not db.exists:
-                status = Text("🔴 GONE", style="red")
-            elif not db.healthy:
-                status = Text("⚠️ ERR", style="yellow")
-            elif db.watcher_running:
-                status = Text("🟢 UP", style="green")
-            else:
-                status = Text("⚪ --", style="dim")
-
-            # Watcher column
-            if db.watcher_running:
-                watcher = Text(f"🟢 {db.watcher_pid}", style="green")
-            elif db.auto_watch:
-                watcher = Text("⏸ auto", style="yellow")
-            else:
-                watcher = Text("⚪ off", style="dim")
-
-            # Format numbers
-            entities = f"{db.entity_count:,}" if db.entity_count else "-"
-            relations = f"{db.relation_count:,}" if db.relation_count else "-"
-
-            # Track index if this is the previously selected database
-            if db.name == selected_db_name:
-                selected_row_index = idx
-
-            self.add_row(
-                db.name,
-                status,
-                db.total_size_human,
-                entities,
-                relations,
-                db.last_sync_human,
-                watcher,
-                key=db.name
-            )
-
-        # Restore cursor position to previously selected database
-        if selected_row_index is not None and self.row_count > 0:
-            self.move_cursor(row=selected_row_index)
-        elif self.row_count > 0:
-            # Auto-select first database if none was selected
-            self.move_cursor(row=0)
-
-        # Get the database directly from the index since cursor_row may not be updated yet
-        target_row = selected_row_index if selected_row_index is not None else 0
-        if databases and target_row < len(databases):
-            db = databases[target_row]
-            self.post_message(self.DatabaseSelected(db))
+        old = self._row_fields
+        fields = {db.name: self._fields(db) for db in databases}
+        if fields == old and list(fields) == list(old):
+            # No rendered field changed, but listeners still need the fresh stats
+            if self.row_count:
+                self._schedule_selection()
+            return
+        self._row_fields = fields
+
+        selected_db_name = self._cursor_key()
+
+        kept = [name for name in old if name in fields]
+        if kept == list(fields)[:len(kept)]:
+            # Same order with databases removed and/or appended: patch the
+            # rows in place rather than tearing down the table
+            for name in old.keys() - fields.keys():
+                self.remove_row(name)
+            for db in databases:
+                previous = old.get(db.name)
+                if previous is None:
+                    self.add_row(*self._row_cells(db), key=db.name)
+                elif previous != fields[db.name]:
+                    for column, value in zip(self.COLUMN_KEYS, self._row_cells(db)):
+                        self.update_cell(db.name, column, value)
+        else:
+            # Reordered: clear and repopulate
+            self.clear()
+            for db in databases:
+                self.add_row(*self._row_cells(db), key=db.name)
+
+        if self.row_count == 0:
+            return
+
+        # Keep the cursor on the previously selected database, else the first
+        names = list(fields)
+        target_row = names.index(selected_db_name) if selected_db_name in fields else 0
+        if target_row != self.cursor_row:
+            self.move_cursor(row=target_row)
+
+        # Re-post the selection so listeners get the fresh stats
+        self._schedule_selection()
 
     def get_selected_database(self) -> DatabaseStats | None:
         """Get the currently selected database."""
-        if self.cursor_row is not None and self.row_count > 0:
-            row_key = self.get_row_at(self.cursor_row)
-            if row_key and row_key.value in self._databases:
-                return self._databases[row_key.value]
-        return None
+        name = self._cursor_key()
+        return self._databases.get(name) if name is not None else None
 
     def action_select_cursor(self) -> None:
         """Handle row selection."""
@@ -141,8 +187,6 @@ class DatabaseTable(DataTable):
         if db:
             self.post_message(self.DatabaseSelected(db))
 
-    def watch_cursor_row(self, old_value: int | None, new_value: int | None) -> None:
-        """Called when cursor row changes."""
-        db = self.get_selected_database()
-        if db:
-            self.post_message(self.DatabaseSelected(db))
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """Called when the cursor moves to another row."""
+        self._schedule_selection()
@@ -6,18 +6,48 @@ Shows 24-hour timeline of when files were last processed each hour.
 """
 
 import json
+import re
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from textual import events
 from textual.widgets import Static
 from textual.reactive import reactive
+from rich.box import SIMPLE
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 
 from ..data_collector import LogEntry
 
+# Tried in order; group 1 is the filename
+_FILENAME_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'Ingested\s+([^\s]+)',
+        r'Processed\s+([^\s]+)',
+        r'Added\s+([^\s]+)',
+        r'file[:\s]+([^\s]+)',
+        r'([^\s/\\]+\.(?:md|txt|json|py|js|ts|yaml|yml))',
+    )
+)
+
+# Log message filters for the timeline, one alternation each so a message is
+# scanned once per set rather than once per keyword
+# Negative keywords - skip error/failure messages (case-insensitive)
+_NEGATIVE_RE = re.compile("|".join(map(re.escape, (
+    "error", "failed", "exception", "traceback", "not found", "missing", "cannot", "unable",
+))), re.IGNORECASE)
+# Positive keywords indicating actual file processing (case-insensitive)
+_POSITIVE_RE = re.compile("|".join(map(re.escape, (
+    "ingest", "processed", "added", "chunk", "success", "complete", "queued", "extracted",
+))), re.IGNORECASE)
+# More specific patterns that indicate actual file activity (matched as-is)
+_SPECIFIC_RE = re.compile("|".join(map(re.escape, (
+    "ingested", "✓", "✅", "files processed", "file processed", "[OK]", "batch complete",
+))))
+
 
 class HistoryPanel(Static, can_focus=True):
     """
@@ -33,18 +63,52 @@ class HistoryPanel(Static, can_focus=True):
     entries: reactive[List[LogEntry]] = reactive([])
     filter_database: reactive[str | None] = reactive(None)
 
+    MAX_ROWS = 30  # Never show more than this many hours
+    ROW_BUFFER = 3  # Extra rows rendered beyond the visible height
+    CHROME_ROWS = 3  # Panel title + subtitle lines and the table header
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._hourly_data: Dict[int, Dict] = {}  # hour (0-23) -> data
+        self._row_limit = self.MAX_ROWS  # Rows rendered by the last refresh_display
+        self._view: tuple | None = None  # (rows, title, subtitle) last rendered
+        # (timestamp, message) -> display file, or None if the entry isn't activity.
+        # The collector re-parses the same log lines every tick, so classify each once.
+        self._entry_files: Dict[tuple, Optional[str]] = {}
+        # metadata path -> ((mtime_ns, size), [(timestamp, record), ...]) from the last read
+        self._metadata_cache: Dict[Path, tuple] = {}
+
+    def _visible_row_limit(self) -> int:
+        """Number of timeline rows worth rendering at the current height."""
+        height = self.content_size.height
+        if height <= 0:
+            # Not laid out yet - render the full window
+            return self.MAX_ROWS
+        return min(self.MAX_ROWS, max(0, height - self.CHROME_ROWS) + self.ROW_BUFFER)
+
+    def on_resize(self, event: events.Resize) -> None:
+        """Re-render when the panel grows or shrinks past the rendered rows."""
+        if self._hourly_data and self._visible_row_limit() != self._row_limit:
+            self.refresh_display()
 
     def on_mount(self) -> None:
-        """Initialize with empty timeline."""
-        self._compute_24h_timeline()
-        self.refresh_display()
+        """Initialize timeline once the first frame has painted."""
+        self.call_after_refresh(self._refresh_timeline)
 
     def update_entries(self, entries: List[LogEntry]) -> None:
         """Update with new log entries."""
+        # Keep classifications only for entries still in the window
+        known = self._entry_files
+        self._entry_files = {
+            key: known[key]
+            for entry in entries
+            if (key := (entry.timestamp, entry.message)) in known
+        }
         self.entries = entries
+        self._refresh_timeline()
+
+    def _refresh_timeline(self) -> None:
+        """Recompute the timeline and redraw."""
         self._compute_24h_timeline()
         self.refresh_display()
 
@@ -67,6 +131,7 @@ class HistoryPanel(Static, can_focus=True):
         cutoff = now - timedelta(hours=48)
 
         # Source 1: Log entries
+        entry_files = self._entry_files
         for entry in self.entries:
             # Skip entries older than 48 hours
             if entry.timestamp < cutoff:
@@ -76,20 +141,12 @@ class HistoryPanel(Static, can_focus=True):
             if self.filter_database and entry.database != self.filter_database:
                 continue
 
-            # Count file processing and success messages
-            msg_lower = entry.message.lower()
-
-            # Negative keywords - skip error/failure messages
-            negative_keywords = ["error", "failed", "exception", "traceback", "not found", "missing", "cannot", "unable"]
-            if any(neg in msg_lower for neg in negative_keywords):
-                continue
-
-            # Positive keywords indicating actual file processing
-            keywords = ["ingest", "processed", "added", "chunk", "success", "complete", "queued", "extracted"]
-            # More specific patterns that indicate actual file activity
-            specific_patterns = ["ingested", "✓", "✅", "files processed", "file processed", "[OK]", "batch complete"]
-
-            if not any(kw in msg_lower for kw in keywords) and not any(p in entry.message for p in specific_patterns):
+            key = (entry.timestamp, entry.message)
+            if key in entry_files:
+                last_file = entry_files[key]
+            else:
+                last_file = entry_files[key] = self._classify_entry(entry)
+            if last_file is None:
                 continue
 
             # Calculate which hour bucket (0 = current hour, 47 = 48 hours ago)
@@ -104,25 +161,25 @@ class HistoryPanel(Static, can_focus=True):
             # Track the most recent file in this hour
             if data["last_time"] is None or entry.timestamp > data["last_time"]:
                 data["last_time"] = entry.timestamp
-                data["last_file"] = self._extract_filename(entry.message) or entry.message[:50]
+                data["last_file"] = last_file
 
         # Source 2: database_metadata.json ingestion history (captures watcher activity)
         self._add_metadata_history(cutoff, now)
 
+    def _classify_entry(self, entry: LogEntry) -> Optional[str]:
+        """Return the file to display for a processing entry, or None to skip it."""
+        # Count file processing and success messages
+        message = entry.message
+        if _NEGATIVE_RE.search(message):
+            return None
+        if not (_POSITIVE_RE.search(message) or _SPECIFIC_RE.search(message)):
+            return None
+        return self._extract_filename(message) or message[:50]
+
     def _extract_filename(self, message: str) -> Optional[str]:
         """Extract filename from log message."""
-        import re
-
-        patterns = [
-            r'Ingested\s+([^\s]+)',
-            r'Processed\s+([^\s]+)',
-            r'Added\s+([^\s]+)',
-            r'file[:\s]+([^\s]+)',
-            r'([^\s/\\]+\.(?:md|txt|json|py|js|ts|yaml|yml))',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, message, re.IGNORECASE)
+        for pattern in _FILENAME_PATTERNS:
+            match = pattern.search(message)
             if match:
                 return match.group(1)
 
@@ -150,20 +207,17 @@ class HistoryPanel(Static, can_focus=True):
 
                 # Check for metadata file
                 metadata_path = Path(entry.path) / "database_metadata.json"
-                if not metadata_path.exists():
-                    continue
-
                 try:
-                    with open(metadata_path, 'r') as f:
-                        metadata = json.load(f)
+                    ingestion_history = self._load_ingestion_history(metadata_path)
+                    if ingestion_history is None:
+                        continue
 
-                    # Look for ingestion history in metadata
-                    ingestion_history = metadata.get("ingestion_history", [])
-                    for record in ingestion_history:
+                    # Records are appended as they happen, so scan newest
+                    # first and stop at the cutoff
+                    for timestamp, record in reversed(ingestion_history):
                         try:
-                            timestamp = datetime.fromisoformat(record.get("timestamp", ""))
                             if timestamp < cutoff:
-                                continue
+                                break
 
                             hours_ago = int((now - timestamp).total_seconds() / 3600)
                             if hours_ago < 0 or hours_ago >= 48:
@@ -187,27 +241,43 @@ class HistoryPanel(Static, can_focus=True):
             # Silently fail if registry not available
             pass
 
+    def _load_ingestion_history(self, metadata_path: Path) -> Optional[List[tuple]]:
+        """Read a metadata file's ingestion history as (timestamp, record) pairs.
+
+        The file is only re-read, and its timestamps re-parsed, when it changed.
+        """
+        try:
+            st = metadata_path.stat()
+        except OSError:
+            self._metadata_cache.pop(metadata_path, None)
+            return None
+
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = self._metadata_cache.get(metadata_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        with open(metadata_path, 'r') as f:
+            metadata = json.load(f)
+
+        history = []
+        for record in metadata.get("ingestion_history", []):
+            try:
+                history.append((datetime.fromisoformat(record.get("timestamp", "")), record))
+            except (ValueError, TypeError):
+                continue  # Skip records without a valid timestamp
+        self._metadata_cache[metadata_path] = (signature, history)
+        return history
+
     def refresh_display(self) -> None:
         """Refresh the panel display."""
         now = datetime.now()
 
-        table = Table(
-            show_header=True,
-            header_style="bold cyan",
-            expand=True,
-            box=None,
-            padding=(0, 1)
-        )
-
-        table.add_column("Hour", style="dim", width=14)
-        table.add_column("Status", width=8, justify="center")
-        table.add_column("Files", style="green", justify="right", width=6)
-        table.add_column("Last Processed", style="white", overflow="ellipsis")
-
         total_files = 0
         active_hours = 0
-        rows_shown = 0
-        max_rows = 30  # Show up to 30 most recent entries
+        rows = []
+        # Rows below the fold are clipped anyway, so don't format them
+        max_rows = self._row_limit = self._visible_row_limit()
 
         # Collect all hour data first to count totals
         for hours_ago in range(48):
@@ -217,9 +287,9 @@ class HistoryPanel(Static, can_focus=True):
             if count > 0:
                 active_hours += 1
 
-        # Show hours in order (current hour first), limited to 30 rows
+        # Show hours in order (current hour first), limited to max_rows
         for hours_ago in range(48):
-            if rows_shown >= max_rows:
+            if len(rows) >= max_rows:
                 break
 
             data = self._hourly_data.get(hours_ago, {"count": 0})
@@ -258,27 +328,48 @@ class HistoryPanel(Static, can_focus=True):
                 count_str = "[dim]-[/dim]"
                 last_display = "[dim]No activity[/dim]"
 
-            table.add_row(hour_label, status, count_str, last_display)
-            rows_shown += 1
+            rows.append((hour_label, status, count_str, last_display))
+
+        title = f"Processing Timeline | [bold green]{total_files} files[/bold green] processed in {active_hours} hours"
+        subtitle = f"[dim]{self.filter_database or 'All databases'} | ● active ○ idle | 48h window[/dim]"
+
+        # Most ticks change nothing visible; skip building and rendering the table then
+        view = (tuple(rows), title, subtitle)
+        if view == self._view:
+            return
+        self._view = view
+
+        table = Table(
+            show_header=True,
+            header_style="bold cyan",
+            expand=True,
+            box=None,
+            padding=(0, 1)
+        )
+
+        table.add_column("Hour", style="dim", width=14)
+        table.add_column("Status", width=8, justify="center")
+        table.add_column("Files", style="green", justify="right", width=6)
+        table.add_column("Last Processed", style="white", overflow="ellipsis")
+
+        for row in rows:
+            table.add_row(*row)
 
-        from rich.box import SIMPLE
         self.update(Panel(
             table,
             border_style="dim",
             box=SIMPLE,
-            title=f"Processing Timeline | [bold green]{total_files} files[/bold green] processed in {active_hours} hours",
-            subtitle=f"[dim]{self.filter_database or 'All databases'} | ● active ○ idle | 48h window[/dim]"
+            title=title,
+            subtitle=subtitle
         ))
 
     def set_filter(self, db_name: Optional[str]) -> None:
         """Set database filter."""
+        # The watcher recomputes, and only fires when the filter actually changes
         self.filter_database = db_name
-        self._compute_24h_timeline()
-        self.refresh_display()
 
     def watch_filter_database(self, old_value: str | None, new_value: str | None) -> None:
         """Called when filter changes."""
-        # Only recompute if we have entries
-        if self.entries:
-            self._compute_24h_timeline()
-            self.refresh_display()
+        # Only recompute once the timeline has been built (not on mount)
+        if self._hourly_data:
+            self._refresh_timeline()
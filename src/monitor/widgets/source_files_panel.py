@@ -5,11 +5,16 @@ Source Files Panel Widget
 Shows list of source files with last modified times for debugging.
 """
 
-from datetime import datetime
-from pathlib import Path
-from typing import List, Optional
+import heapq
+import logging
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Iterator, List, Optional
 import os
 
+from textual import work
 from textual.widgets import Static
 from textual.reactive import reactive
 from rich.table import Table
@@ -18,6 +23,109 @@ from rich.text import Text
 from rich.box import SIMPLE
 
 from ..data_collector import DatabaseStats
+from ...utils import iter_files
+
+try:
+    # Optional: with watchfiles, scans stay valid until the folder reports a change
+    from watchfiles import watch as _watch_changes
+except ImportError:
+    _watch_changes = None
+
+logger = logging.getLogger(__name__)
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB')
+
+# Tool/VCS/editor directories that never hold source documents. Other hidden
+# directories (e.g. .specstory) are still walked, matching the folder watcher.
+# HYBRIDRAG_MONITOR_SKIP_DIRS adds project-specific names (comma separated).
+_SKIP_DIRS = frozenset({
+    ".git", ".hg", ".svn", "__pycache__", "node_modules",
+    ".venv", "venv", ".tox", ".mypy_cache", ".pytest_cache", ".ruff_cache",
+    ".idea", ".vscode",
+    *filter(None, (
+        name.strip()
+        for name in os.environ.get("HYBRIDRAG_MONITOR_SKIP_DIRS", "").split(",")
+    )),
+})
+
+
+def _stat_workers_from_env() -> int:
+    """HYBRIDRAG_MONITOR_STAT_WORKERS as a thread count; invalid values mean 0."""
+    value = os.environ.get("HYBRIDRAG_MONITOR_STAT_WORKERS", "").strip()
+    if not value:
+        return 0
+    try:
+        workers = int(value)
+    except ValueError:
+        workers = -1
+    if workers < 0:
+        logger.warning(
+            "Ignoring invalid HYBRIDRAG_MONITOR_STAT_WORKERS=%r; expected a thread count >= 0",
+            value,
+        )
+        return 0
+    return workers
+
+
+# Threads used to stat() files during source folder scans. Off (0) by default:
+# local disks gain nothing, but network mounts pay a round trip per stat.
+_STAT_WORKERS = _stat_workers_from_env()
+
+
+@lru_cache(maxsize=4096)
+def _humanize_size(size_bytes: int) -> str:
+    """Convert bytes to human readable (memoized; file sizes repeat a lot)."""
+    for unit in _SIZE_UNITS:
+        if abs(size_bytes) < 1024.0:
+            return f"{size_bytes:.0f}{unit}"
+        size_bytes /= 1024.0
+    return f"{size_bytes:.0f}TB"
+
+
+def _humanize_time(mtime: float, now: float) -> tuple[str, str]:
+    """Convert a timestamp to (time relative to now, style by recency)."""
+    seconds = now - mtime
+
+    if seconds < 60:
+        return "just now", "green bold"
+    elif seconds < 3600:
+        mins = int(seconds / 60)
+        return f"{mins}m ago", "green bold"
+    elif seconds < 86400:
+        hours = int(seconds / 3600)
+        return f"{hours}h ago", "yellow"
+    else:
+        days = int(seconds / 86400)
+        return f"{days}d ago", "dim"
+
+
+def _stat_entry(entry: os.DirEntry) -> Optional[tuple[os.DirEntry, os.stat_result]]:
+    """(entry, stat) for a file, or None if it can no longer be read."""
+    try:
+        return entry, entry.stat()
+    except OSError:
+        return None
+
+
+def _iter_file_stats(
+    folder: str,
+    skip_dirs: frozenset[str] = _SKIP_DIRS,
+    stat_pool: Optional[Executor] = None,
+) -> Iterator[tuple[os.DirEntry, os.stat_result]]:
+    """Yield (entry, stat) for every file under folder, skipping skip_dirs.
+
+    Files that can no longer be stat()ed are skipped. With a stat_pool, files
+    are collected during the walk and stat()ed concurrently afterwards, which
+    pays off when each stat is a network round trip.
+    """
+    entries = iter_files(folder, skip_dirs=skip_dirs)
+    if stat_pool is None:
+        items = map(_stat_entry, entries)
+    else:
+        items = stat_pool.map(_stat_entry, entries, chunksize=64)
+    for item in items:
+        if item is not None:
+            yield item
 
 
 class SourceFilesPanel(Static, can_focus=True):
@@ -32,66 +140,127 @@ class SourceFilesPanel(Static, can_focus=True):
 
     database: reactive[DatabaseStats | None] = reactive(None)
     max_files: int = 50  # Show more files (was 15)
+    skip_dirs: frozenset[str] = _SKIP_DIRS  # Subdirectories never scanned
+    stat_workers: int = _STAT_WORKERS  # Threads for stat() during scans; >1 helps on network mounts
+    SCAN_TTL = 10.0  # Seconds a folder scan is reused while the folder itself is unchanged
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._total_files: int = 0  # Track total for display
+        # source folder -> (scanned at, folder mtime_ns, total files, newest files)
+        self._scan_cache: dict[str, tuple[float, int, int, List[dict]]] = {}
+        self._watched_folder: str | None = None  # Folder with a live change watch
+        self._watch_stop: threading.Event | None = None  # Stops the current watch
+        self._shown_view: tuple | None = None  # Last _files_view rendered
+        self._shown_name: str | None = None  # Database the shown view belongs to
+        self._scanning: set[str] = set()  # Source folders with a scan in flight
+        # Source folder -> (failed at, error), retried once SCAN_TTL old
+        self._scan_errors: dict[str, tuple[float, str]] = {}
+        # Database name -> (view, rendered panel), reused when switching back
+        self._panels: dict[str, tuple[tuple, Panel]] = {}
 
-    def _get_source_files(self, source_folder: str) -> List[dict]:
-        """Get files from source folder with metadata."""
-        files = []
-        source_path = Path(source_folder)
+    def _get_source_files(self, source_folder: str) -> Optional[List[dict]]:
+        """Get the most recently modified files in source folder from a recent scan.
 
-        if not source_path.exists():
-            return files
+        Returns None when the folder needs a (re)scan. The folder's own mtime
+        catches files added or removed at the top level; changes deeper in the
+        tree show up once the scan is SCAN_TTL old, or as soon as they happen
+        when the folder is watched.
+        """
+        try:
+            folder_mtime = os.stat(source_folder).st_mtime_ns
+        except OSError:
+            self._scan_cache.pop(source_folder, None)
+            self._total_files = 0
+            return []
+
+        cached = self._scan_cache.get(source_folder)
+        fresh = source_folder == self._watched_folder or (
+            cached is not None and time.monotonic() - cached[0] < self.SCAN_TTL
+        )
+        if cached is not None and fresh and cached[1] == folder_mtime:
+            self._total_files = cached[2]
+            return cached[3]
+        return None
+
+    def _scan_source_files(self, source_folder: str) -> tuple[int, List[dict]]:
+        """Scan source folder for (total files, most recently modified files).
+
+        Runs in a worker thread, so it only reads from self.
+        """
+        total = 0
+
+        def counted(items):
+            nonlocal total
+            for item in items:
+                total += 1
+                yield item
+
+        def newest_files(stat_pool=None):
+            # Only the newest max_files are kept, so select them without sorting everything
+            return heapq.nlargest(
+                self.max_files,
+                counted(_iter_file_stats(source_folder, self.skip_dirs, stat_pool)),
+                key=lambda item: item[1].st_mtime,
+            )
+
+        if self.stat_workers > 1:
+            with ThreadPoolExecutor(max_workers=self.stat_workers) as pool:
+                newest = newest_files(pool)
+        else:
+            newest = newest_files()
 
+        prefix_len = len(os.path.join(source_folder, ""))
+        return total, [
+            {
+                "name": entry.name,
+                "path": entry.path,
+                "size": stat.st_size,
+                "mtime": stat.st_mtime,
+                "relative": entry.path[prefix_len:]
+            }
+            for entry, stat in newest
+        ]
+
+    @work(thread=True, group="source-scan", exit_on_error=False)
+    def _scan_in_background(self, source_folder: str) -> None:
+        """Scan a source folder off the event loop, then re-render.
+
+        _scan_finished always runs, so a failed scan can't leave the folder
+        marked as scanning.
+        """
+        started = time.monotonic()
+        folder_mtime = None
+        result = None
+        error = None
         try:
-            # Get all files recursively
-            for file_path in source_path.rglob('*'):
-                if file_path.is_file():
-                    try:
-                        stat = file_path.stat()
-                        files.append({
-                            "name": file_path.name,
-                            "path": str(file_path),
-                            "size": stat.st_size,
-                            "modified": datetime.fromtimestamp(stat.st_mtime),
-                            "relative": str(file_path.relative_to(source_path))
-                        })
-                    except (OSError, PermissionError):
-                        pass
-        except (OSError, PermissionError):
-            pass
-
-        # Sort by modified time (most recent first)
-        files.sort(key=lambda f: f["modified"], reverse=True)
-        self._total_files = len(files)  # Track total before limiting
-        return files[:self.max_files]
-
-    def _humanize_size(self, size_bytes: int) -> str:
-        """Convert bytes to human readable."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if abs(size_bytes) < 1024.0:
-                return f"{size_bytes:.0f}{unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.0f}TB"
-
-    def _humanize_time(self, dt: datetime) -> str:
-        """Convert datetime to relative time."""
-        now = datetime.now()
-        delta = now - dt
-
-        if delta.total_seconds() < 60:
-            return "just now"
-        elif delta.total_seconds() < 3600:
-            mins = int(delta.total_seconds() / 60)
-            return f"{mins}m ago"
-        elif delta.total_seconds() < 86400:
-            hours = int(delta.total_seconds() / 3600)
-            return f"{hours}h ago"
+            try:
+                folder_mtime = os.stat(source_folder).st_mtime_ns
+            except OSError:
+                pass
+            result = self._scan_source_files(source_folder)
+        except Exception as e:
+            logger.warning("Scanning source folder %s failed", source_folder, exc_info=True)
+            error = str(e) or type(e).__name__
+        finally:
+            self.app.call_from_thread(
+                self._scan_finished, source_folder, started, folder_mtime, result, error
+            )
+
+    def _scan_finished(
+        self, source_folder: str, started: float, folder_mtime: int | None,
+        result: tuple[int, List[dict]] | None, error: str | None,
+    ) -> None:
+        self._scanning.discard(source_folder)
+        if result is None:
+            self._scan_cache.pop(source_folder, None)
+            self._scan_errors[source_folder] = (started, error or "scan failed")
         else:
-            days = delta.days
-            return f"{days}d ago"
+            self._scan_errors.pop(source_folder, None)
+            if folder_mtime is not None:
+                self._scan_cache[source_folder] = (started, folder_mtime, *result)
+        if self.database and self.database.source_folder == source_folder:
+            self._show(self.database)
 
     def _render_empty(self) -> Panel:
         """Render when no database selected."""
@@ -102,26 +271,74 @@ class SourceFilesPanel(Static, can_focus=True):
             box=SIMPLE
         )
 
-    def _render_files(self, db: DatabaseStats) -> Panel:
-        """Render file list for database."""
+    def _files_view(self, db: DatabaseStats | None) -> tuple | None:
+        """Everything the panel shows for a database, as plain values.
+
+        None means the source folder has to be scanned first.
+        """
+        if db is None:
+            return ("empty",)
         if not db.source_folder:
+            return ("no-folder", db.name)
+
+        files = self._get_source_files(db.source_folder)
+        if files is None:
+            failed = self._scan_errors.get(db.source_folder)
+            if failed is not None and time.monotonic() - failed[0] < self.SCAN_TTL:
+                return ("scan-error", db.name, failed[1])
+            return None  # Scan pending
+        if not files:
+            return ("no-files", db.name)
+
+        now = time.time()
+        rows = tuple(
+            (f["name"][:30], *_humanize_time(f["mtime"], now), _humanize_size(f["size"]))
+            for f in files
+        )
+
+        # Summary
+        source_short = db.source_folder
+        if len(source_short) > 40:
+            source_short = "..." + source_short[-37:]
+
+        return ("files", rows, self._total_files, source_short)
+
+    def _render_view(self, view: tuple) -> Panel:
+        """Render a view built by _files_view."""
+        kind = view[0]
+        if kind == "empty":
+            return self._render_empty()
+        if kind == "no-folder":
             return Panel(
                 Text("No source folder configured", style="dim italic"),
-                title=f"Source Files: {db.name}",
+                title=f"Source Files: {view[1]}",
                 border_style="dim",
                 box=SIMPLE
             )
-
-        files = self._get_source_files(db.source_folder)
-
-        if not files:
+        if kind == "no-files":
             return Panel(
                 Text("No files found in source folder", style="dim italic"),
-                title=f"Source Files: {db.name}",
+                title=f"Source Files: {view[1]}",
+                border_style="dim",
+                box=SIMPLE
+            )
+        if kind == "scan-error":
+            return Panel(
+                Text(f"Scan failed: {view[2]}", style="red italic"),
+                title=f"Source Files: {view[1]}",
+                border_style="dim",
+                box=SIMPLE
+            )
+        if kind == "scanning":
+            return Panel(
+                Text("Scanning source folder...", style="dim italic"),
+                title=f"Source Files: {view[1]}",
                 border_style="dim",
                 box=SIMPLE
             )
 
+        _, rows, total_files, source_short = view
+
         table = Table(
             show_header=True,
             header_style="bold",
@@ -134,32 +351,14 @@ class SourceFilesPanel(Static, can_focus=True):
         table.add_column("Modified", style="cyan", width=10)
         table.add_column("Size", style="dim", justify="right", width=8)
 
-        for f in files:
-            # Color based on recency
-            mod_time = self._humanize_time(f["modified"])
-            if "just now" in mod_time or "m ago" in mod_time:
-                time_style = "green bold"
-            elif "h ago" in mod_time:
-                time_style = "yellow"
-            else:
-                time_style = "dim"
-
-            table.add_row(
-                f["name"][:30],
-                Text(mod_time, style=time_style),
-                self._humanize_size(f["size"])
-            )
-
-        # Summary
-        source_short = db.source_folder
-        if len(source_short) > 40:
-            source_short = "..." + source_short[-37:]
+        for name, mod_time, time_style, size in rows:
+            table.add_row(name, Text(mod_time, style=time_style), size)
 
         # Show total vs displayed count
-        if self._total_files > len(files):
-            title = f"Source Files ({len(files)} of {self._total_files})"
+        if total_files > len(rows):
+            title = f"Source Files ({len(rows)} of {total_files})"
         else:
-            title = f"Source Files ({len(files)} total)"
+            title = f"Source Files ({len(rows)} total)"
 
         return Panel(
             table,
@@ -169,18 +368,93 @@ class SourceFilesPanel(Static, can_focus=True):
             box=SIMPLE
         )
 
+    def _show(self, db: DatabaseStats | None) -> None:
+        """Render the panel for db, unless it would look the same as now."""
+        view = self._files_view(db)
+        name = db.name if db else None
+        if view is None:
+            # Scan in a thread so a slow mount doesn't stall the UI; _scan_finished
+            # re-renders. Meanwhile keep showing this database's last files.
+            if db.source_folder not in self._scanning:
+                self._scanning.add(db.source_folder)
+                self._scan_in_background(db.source_folder)
+            if name == self._shown_name:
+                return
+            cached = self._panels.get(name)
+            view = cached[0] if cached is not None else ("scanning", name)
+
+        if view == self._shown_view:
+            return
+        self._shown_view = view
+        self._shown_name = name
+        if db is None:
+            self.update(self._render_view(view))
+            return
+        cached = self._panels.get(name)
+        if cached is not None and cached[0] == view:
+            panel = cached[1]
+        else:
+            panel = self._render_view(view)
+            if view[0] != "scanning":
+                self._panels[name] = (view, panel)
+        self.update(panel)
+
     def watch_database(self, database: DatabaseStats | None) -> None:
         """Called when database changes."""
-        if database:
-            self.update(self._render_files(database))
-        else:
-            self.update(self._render_empty())
+        self._watch_folder(database.source_folder if database else None)
+        self._show(database)
 
     def on_mount(self) -> None:
         """Initialize with empty content."""
-        self.update(self._render_empty())
+        self._show(None)
+
+    def on_unmount(self) -> None:
+        """Stop watching the source folder."""
+        self._watch_folder(None)
 
     def refresh_files(self) -> None:
         """Refresh the file list."""
         if self.database:
-            self.update(self._render_files(self.database))
+            self._show(self.database)
+
+    def _watch_folder(self, folder: str | None) -> None:
+        """Switch the change watch to folder (None stops watching)."""
+        if folder == self._watched_folder or _watch_changes is None:
+            return
+        if self._watch_stop is not None:
+            self._watch_stop.set()
+            self._watch_stop = None
+        self._watched_folder = None
+        if folder and os.path.isdir(folder):
+            self._watched_folder = folder
+            self._watch_stop = threading.Event()
+            self._watch_source_folder(folder, self._watch_stop)
+
+    @work(thread=True, group="source-watch")
+    def _watch_source_folder(self, folder: str, stop: threading.Event) -> None:
+        """Invalidate the folder's scan whenever files under it change."""
+        try:
+            for _changes in _watch_changes(folder, stop_event=stop, debounce=500):
+                self.app.call_from_thread(self._source_folder_changed, folder)
+        except FileNotFoundError:
+            pass  # Folder removed
+        except Exception:
+            # Permissions, inotify watch limits, ...
+            logger.warning(
+                "Watching source folder %s failed; rescanning every %ss instead",
+                folder, self.SCAN_TTL, exc_info=True,
+            )
+        # Without a watch the scan falls back to SCAN_TTL expiry
+        if not stop.is_set():
+            self.app.call_from_thread(self._source_watch_ended, folder)
+
+    def _source_folder_changed(self, folder: str) -> None:
+        self._scan_cache.pop(folder, None)
+        self._scan_errors.pop(folder, None)
+        if self.database and self.database.source_folder == folder:
+            self.refresh_files()
+
+    def _source_watch_ended(self, folder: str) -> None:
+        if self._watched_folder == folder:
+            self._watched_folder = None
+            self._watch_stop = None
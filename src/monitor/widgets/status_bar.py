@@ -8,11 +8,13 @@ Bottom status bar showing summary statistics.
 from textual.widgets import Static
 from textual.reactive import reactive
 from rich.text import Text
-from rich.console import Group
-from rich.columns import Columns
 
 from ..data_collector import MonitorSnapshot
 
+# Constant (text, style) pieces of the status line
+_SEPARATOR = (" │ ", "dim")
+_NO_ERRORS = ("Errors: 0", "green")
+
 
 class StatusBar(Static):
     """
@@ -32,17 +34,43 @@ class StatusBar(Static):
     def __init__(self, refresh_interval: int = 2, **kwargs):
         super().__init__(**kwargs)
         self.refresh_interval = refresh_interval
+        self.effective_interval = refresh_interval  # Stretched when refreshes are slow
+        # _signature of the status currently shown; None forces the next redraw
+        self._shown_signature: tuple | None = None
+
+    def _signature(self, snapshot: MonitorSnapshot | None) -> tuple:
+        """The values _render_status reads."""
+        if not snapshot:
+            return ()
+        return (
+            len(snapshot.databases),
+            snapshot.watchers_running,
+            snapshot.watchers_total,
+            snapshot.total_entities,
+            snapshot.total_size_human,
+            len(snapshot.errors),
+            self.refresh_interval,
+            self.effective_interval,
+        )
+
+    def _show(self, snapshot: MonitorSnapshot | None) -> None:
+        """Redraw, unless the status line would come out the same."""
+        signature = self._signature(snapshot)
+        if signature == self._shown_signature:
+            return
+        self._shown_signature = signature
+        self.update(self._render_status(snapshot))
 
     def _render_status(self, snapshot: MonitorSnapshot | None) -> Text:
         """Render status bar content."""
         if not snapshot:
             return Text("Loading...", style="dim italic")
 
-        parts = []
+        parts: list[tuple[str, str]] = []
 
         # Databases count
         db_count = len(snapshot.databases)
-        parts.append(Text(f"Databases: {db_count}", style="cyan"))
+        parts.append((f"Databases: {db_count}", "cyan"))
 
         # Watchers
         if snapshot.watchers_running == snapshot.watchers_total and snapshot.watchers_total > 0:
@@ -51,41 +79,52 @@ class StatusBar(Static):
             watcher_style = "yellow"
         else:
             watcher_style = "dim"
-        parts.append(Text(
+        parts.append((
             f"Watchers: {snapshot.watchers_running}/{snapshot.watchers_total}",
-            style=watcher_style
+            watcher_style
         ))
 
         # Entities
         if snapshot.total_entities > 0:
-            parts.append(Text(f"Entities: {snapshot.total_entities:,}", style="white"))
+            parts.append((f"Entities: {snapshot.total_entities:,}", "white"))
 
         # Size
-        parts.append(Text(f"Size: {snapshot.total_size_human}", style="white"))
-
-        # Refresh interval
-        parts.append(Text(f"Refresh: {self.refresh_interval}s", style="dim"))
+        parts.append((f"Size: {snapshot.total_size_human}", "white"))
+
+        # Refresh interval (flag when stretched because refreshes are slow)
+        if self.effective_interval > self.refresh_interval:
+            parts.append((
+                f"Refresh: {self.effective_interval}s (slow, wanted {self.refresh_interval}s)",
+                "yellow"
+            ))
+        else:
+            parts.append((f"Refresh: {self.refresh_interval}s", "dim"))
 
         # Errors
         error_count = len(snapshot.errors)
         if error_count > 0:
-            parts.append(Text(f"Errors: {error_count}", style="red bold"))
+            parts.append((f"Errors: {error_count}", "red bold"))
         else:
-            parts.append(Text("Errors: 0", style="green"))
+            parts.append(_NO_ERRORS)
 
-        # Join with separators
-        result = Text()
-        for i, part in enumerate(parts):
-            if i > 0:
-                result.append(" │ ", style="dim")
-            result.append_text(part)
+        # Join with separators in a single Text
+        joined = [parts[0]]
+        for part in parts[1:]:
+            joined.append(_SEPARATOR)
+            joined.append(part)
+        return Text.assemble(*joined)
 
-        return result
+    def set_effective_interval(self, interval: int) -> None:
+        """Update the effective refresh interval and redraw."""
+        self.effective_interval = interval
+        if self.snapshot:
+            self._show(self.snapshot)
 
     def watch_snapshot(self, snapshot: MonitorSnapshot | None) -> None:
         """Called when snapshot reactive changes."""
-        self.update(self._render_status(snapshot))
+        self._show(snapshot)
 
     def on_mount(self) -> None:
         """Initialize with loading state."""
         self.update(Text("Initializing...", style="dim italic"))
+        self._shown_signature = None
@@ -14,7 +14,6 @@ from rich.table import Table
 from rich.box import SIMPLE
 from rich.progress_bar import ProgressBar
 from rich.console import Group
-from rich.columns import Columns
 
 from ..data_collector import DatabaseStats
 
@@ -37,6 +36,25 @@ class WatcherPanel(Static, can_focus=True):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._default_content = self._render_empty()
+        # Rendered fields of the database last shown (() for the empty panel)
+        self._shown_signature: tuple | None = None
+        # Database name -> (signature, rendered panel), reused when switching back
+        self._panels: dict[str, tuple[tuple, Panel]] = {}
+
+    @staticmethod
+    def _signature(db: DatabaseStats | None) -> tuple:
+        """The fields _render_watcher reads from a database."""
+        if db is None:
+            return ()
+        return (
+            db.name, db.watcher_running, db.watcher_pid, db.watcher_mode,
+            db.watch_interval, db.source_folder, db.auto_watch,
+            db.entity_count, db.relation_count, db.chunk_count, db.document_count,
+            tuple(db.file_warnings[:3]),
+            tuple(sorted(db.processing_progress.items())) if db.processing_progress else (),
+            len(db.processing_files), tuple(db.processing_files[:3]),
+            tuple(db.recent_files[:5]),
+        )
 
     def _render_empty(self) -> Panel:
         """Render panel when no database selected."""
@@ -141,10 +159,16 @@ class WatcherPanel(Static, can_focus=True):
 
             if total > 0:
                 pct = int((current / total) * 100)
-                bar_filled = pct // 5  # 20 chars total
-                bar_empty = 20 - bar_filled
-                bar = f"[green]{'█' * bar_filled}[/green][dim]{'░' * bar_empty}[/dim]"
-                sections.append(Text.from_markup(f"⏳ Chunks: {bar} {pct}% ({current:,}/{total:,})"))
+                progress_row = Table.grid(padding=(0, 1))
+                progress_row.add_row(
+                    "⏳ Chunks:",
+                    ProgressBar(
+                        total=total, completed=current, width=20,
+                        complete_style="green", finished_style="green",
+                    ),
+                    f"{pct}% ({current:,}/{total:,})",
+                )
+                sections.append(progress_row)
                 if current_file:
                     short_file = current_file[-30:] if len(current_file) > 30 else current_file
                     sections.append(Text(f"   → {short_file}", style="dim"))
@@ -177,11 +201,24 @@ class WatcherPanel(Static, can_focus=True):
 
     def watch_database(self, database: DatabaseStats | None) -> None:
         """Called when database reactive changes."""
+        # The collector rebuilds the stats every refresh; skip the re-render
+        # when nothing this panel shows has changed
+        signature = self._signature(database)
+        if signature == self._shown_signature:
+            return
+        self._shown_signature = signature
         if database:
-            self.update(self._render_watcher(database))
+            cached = self._panels.get(database.name)
+            if cached is not None and cached[0] == signature:
+                panel = cached[1]
+            else:
+                panel = self._render_watcher(database)
+                self._panels[database.name] = (signature, panel)
+            self.update(panel)
         else:
             self.update(self._default_content)
 
     def on_mount(self) -> None:
         """Initialize with empty content."""
         self.update(self._default_content)
+        self._shown_signature = ()
@@ -15,10 +15,28 @@ from dataclasses import dataclass
 from pathlib import Path
 import json
 import os
+import hashlib
+
+from src.utils import iter_files
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# File extensions the folder watcher queues for ingestion
+_WATCH_EXTENSIONS = frozenset({'.md'})
+
+
+def _hash_file(file_path: Path) -> str:
+    """SHA-256 hex digest of a file's content."""
+    with open(file_path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+: reads and hashes in C
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        file_hash = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            file_hash.update(chunk)
+        return file_hash.hexdigest()
+
+
+@dataclass(slots=True)
 class ProcessStatus:
     """Status information for a process."""
     name: str
@@ -28,7 +46,7 @@ class ProcessStatus:
     stats: Dict[str, Any]
     error: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class IngestionProgress:
     """Progress information for ingestion."""
     total_files: int
@@ -38,6 +56,30 @@ class IngestionProgress:
     processing_rate: float  # files per minute
     estimated_remaining: float  # minutes
 
+class SharedState:
+    """Counters and flags shared with the worker processes.
+
+    Backed by shared memory (mp.Value / mp.Event), so updates are plain
+    memory writes rather than round trips to an mp.Manager server process.
+    """
+
+    def __init__(self):
+        self.watch_folders: List[str] = []  # Set by the main process before starting workers
+        self.total_files_found = mp.Value('q', 0)
+        self.total_files_processed = mp.Value('q', 0)
+        self.ingestion_active = mp.Event()
+        self.lightrag_ready = mp.Event()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Current values, keyed like the status dict reported to callers."""
+        return {
+            'watch_folders': list(self.watch_folders),
+            'total_files_found': self.total_files_found.value,
+            'total_files_processed': self.total_files_processed.value,
+            'ingestion_active': self.ingestion_active.is_set(),
+            'lightrag_ready': self.lightrag_ready.is_set()
+        }
+
 class ProcessManager:
     """Manages all HybridRAG processes and communication."""
     
@@ -53,14 +95,7 @@ class ProcessManager:
         self.status_queue = mp.Queue()          # Status updates
         
         # Shared state
-        self.manager = mp.Manager()
-        self.shared_state = self.manager.dict({
-            'watch_folders': [],
-            'total_files_found': 0,
-            'total_files_processed': 0,
-            'ingestion_active': False,
-            'lightrag_ready': False
-        })
+        self.shared_state = SharedState()
         
         # Process control
         self.shutdown_event = mp.Event()
@@ -71,7 +106,7 @@ class ProcessManager:
     def start_watcher_process(self, watch_folders: List[str], recursive: bool = True):
         """Start the folder watcher process."""
         try:
-            self.shared_state['watch_folders'] = watch_folders
+            self.shared_state.watch_folders = list(watch_folders)
             
             watcher_process = mp.Process(
                 target=self._watcher_worker,
@@ -139,7 +174,7 @@ class ProcessManager:
     def update_status(self):
         """Update process status from status queue."""
         try:
-            while not self.status_queue.empty():
+            while True:
                 try:
                     status_update = self.status_queue.get_nowait()
                     process_name = status_update.get('process')
@@ -158,26 +193,29 @@ class ProcessManager:
             logger.error(f"Error updating status: {e}")
     
     def get_ingestion_progress(self) -> Optional[IngestionProgress]:
-        """Get current ingestion progress."""
+        """Get current ingestion progress (the latest update queued since the last call)."""
+        latest = None
         try:
-            while not self.ingestion_to_main.empty():
+            while True:
                 try:
                     progress_data = self.ingestion_to_main.get_nowait()
-                    if progress_data.get('type') == 'progress':
-                        return IngestionProgress(
-                            total_files=progress_data.get('total_files', 0),
-                            processed_files=progress_data.get('processed_files', 0),
-                            current_file=progress_data.get('current_file', ''),
-                            errors=progress_data.get('errors', 0),
-                            processing_rate=progress_data.get('processing_rate', 0.0),
-                            estimated_remaining=progress_data.get('estimated_remaining', 0.0)
-                        )
                 except queue.Empty:
                     break
+                if progress_data.get('type') == 'progress':
+                    latest = progress_data
         except Exception as e:
             logger.error(f"Error getting ingestion progress: {e}")
         
-        return None
+        if latest is None:
+            return None
+        return IngestionProgress(
+            total_files=latest.get('total_files', 0),
+            processed_files=latest.get('processed_files', 0),
+            current_file=latest.get('current_file', ''),
+            errors=latest.get('errors', 0),
+            processing_rate=latest.get('processing_rate', 0.0),
+            estimated_remaining=latest.get('estimated_remaining', 0.0)
+        )
     
     def get_system_status(self) -> Dict[str, Any]:
         """Get comprehensive system status."""
@@ -204,7 +242,7 @@ class ProcessManager:
                 }
                 for name, status in self.process_status.items()
             },
-            'shared_state': dict(self.shared_state),
+            'shared_state': self.shared_state.as_dict(),
             'queue_sizes': {
                 'watcher_to_ingestion': self.watcher_to_ingestion.qsize(),
                 'ingestion_to_main': self.ingestion_to_main.qsize(),
@@ -244,18 +282,30 @@ class ProcessManager:
         file_queue: mp.Queue,
         status_queue: mp.Queue,
         shutdown_event: mp.Event,
-        shared_state: Dict
+        shared_state: SharedState
     ):
-        """Folder watcher worker process."""
+        """Folder watcher worker process.
+
+        Scans the watch folders once, then waits for filesystem events when
+        watchfiles is installed and only re-checks the changed paths; without
+        it, falls back to rescanning every scan_interval seconds.
+        """
         import time
-        import hashlib
         from pathlib import Path
-        
+
+        try:
+            from watchfiles import watch as watch_changes, Change
+        except ImportError:
+            watch_changes = None
+
         # Setup process logging
         logging.basicConfig(level=logging.INFO)
         logger = logging.getLogger("FolderWatcher")
         
         logger.info(f"Folder watcher started, watching: {watch_folders}")
+
+        # Absolute paths, so scanned paths and watchfiles' event paths match
+        folders = [Path(folder_path).resolve() for folder_path in watch_folders]
         
         # Send initial status
         status_queue.put({
@@ -266,81 +316,177 @@ class ProcessManager:
         
         # Track processed files
         processed_files = set()
+        file_fingerprints: Dict[Path, tuple] = {}  # path -> (inode, size, mtime_ns) last hashed
         scan_interval = 5.0  # seconds
-        
-        try:
-            while not shutdown_event.is_set():
-                files_found = 0
-                new_files = 0
+
+        # New files go to the ingestion worker in lists, one put per batch
+        queue_batch: List[Dict[str, Any]] = []
+        queue_batch_size = 64
+
+        def flush_queue():
+            if queue_batch:
+                file_queue.put(queue_batch.copy())
+                queue_batch.clear()
+
+        def check_file(file_path: Path, stat: Optional[os.stat_result] = None) -> bool:
+            """Queue file_path if it is new or modified; True when queued."""
+            try:
+                # Unchanged stat fingerprint: skip without reading the file
+                if stat is None:
+                    stat = file_path.stat()
+                fingerprint = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+                if file_fingerprints.get(file_path) == fingerprint:
+                    return False
+
+                hash_value = _hash_file(file_path)
+                file_fingerprints[file_path] = fingerprint
+                
+                file_id = f"{file_path}:{hash_value}"
                 
-                for folder_path in watch_folders:
-                    folder = Path(folder_path)
-                    if not folder.exists():
-                        logger.warning(f"Watch folder does not exist: {folder}")
-                        continue
+                if file_id not in processed_files:
+                    # New or modified file
+                    file_info = {
+                        'path': str(file_path),
+                        'name': file_path.name,
+                        'hash': hash_value,
+                        'size': stat.st_size,
+                        'modified': stat.st_mtime,
+                        'extension': file_path.suffix
+                    }
                     
-                    # Scan for files
-                    if recursive:
-                        pattern = "**/*"
-                    else:
-                        pattern = "*"
+                    queue_batch.append(file_info)
+                    if len(queue_batch) >= queue_batch_size:
+                        flush_queue()
+                    processed_files.add(file_id)
                     
-                    for file_path in folder.glob(pattern):
-                        if not file_path.is_file():
-                            continue
-                        
-                        # Check file extension
-                        if file_path.suffix not in ['.md']:
-                            continue
-                        
-                        files_found += 1
-                        
-                        # Calculate file hash
-                        try:
-                            file_hash = hashlib.sha256()
-                            with open(file_path, 'rb') as f:
-                                for chunk in iter(lambda: f.read(4096), b""):
-                                    file_hash.update(chunk)
-                            hash_value = file_hash.hexdigest()
-                            
-                            file_id = f"{file_path}:{hash_value}"
-                            
-                            if file_id not in processed_files:
-                                # New or modified file
-                                file_info = {
-                                    'path': str(file_path),
-                                    'hash': hash_value,
-                                    'size': file_path.stat().st_size,
-                                    'modified': file_path.stat().st_mtime,
-                                    'extension': file_path.suffix
-                                }
-                                
-                                file_queue.put(file_info)
-                                processed_files.add(file_id)
-                                new_files += 1
-                                
-                                logger.info(f"Queued new file: {file_path}")
-                                
-                        except Exception as e:
-                            logger.error(f"Error processing file {file_path}: {e}")
+                    logger.info(f"Queued new file: {file_path}")
+                    return True
+                    
+            except Exception as e:
+                logger.error(f"Error processing file {file_path}: {e}")
+            return False
+
+        def scan_folder(folder: Path) -> tuple[int, int]:
+            """Check every file in folder; (files found, new files)."""
+            files_found = 0
+            new_files = 0
+            
+            for entry in iter_files(str(folder), recursive):
+                # Check file extension
+                if os.path.splitext(entry.name)[1] not in _WATCH_EXTENSIONS:
+                    continue
                 
-                # Update shared state
-                shared_state['total_files_found'] = len(processed_files)
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
                 
-                # Send status update
-                status_queue.put({
-                    'process': 'watcher',
-                    'status': 'running',
-                    'stats': {
-                        'files_found': files_found,
-                        'new_files': new_files,
-                        'total_tracked': len(processed_files),
-                        'last_scan': time.time()
-                    }
-                })
+                files_found += 1
+                if check_file(Path(entry.path), stat):
+                    new_files += 1
+            
+            return files_found, new_files
+
+        def scan_folders() -> tuple[int, int]:
+            """Check every file in the watch folders; (files found, new files)."""
+            files_found = 0
+            new_files = 0
+            
+            for folder in folders:
+                if not folder.exists():
+                    logger.warning(f"Watch folder does not exist: {folder}")
+                    continue
                 
-                # Wait before next scan
-                shutdown_event.wait(timeout=scan_interval)
+                found, new = scan_folder(folder)
+                files_found += found
+                new_files += new
+            
+            return files_found, new_files
+
+        def forget_deleted(deleted: set):
+            """Drop the fingerprints of deleted files and of files under deleted folders.
+
+            A deleted folder only reports its own path, not the files in it.
+            """
+            for file_path in [
+                file_path for file_path in file_fingerprints
+                if file_path in deleted or not deleted.isdisjoint(file_path.parents)
+            ]:
+                del file_fingerprints[file_path]
+
+        def watch_filter(change, path: str) -> bool:
+            """Pass the events a folder scan would act on.
+
+            Files with a watched extension in any folder (hidden or not, as
+            scanned), folders being added, and every deletion, since a deleted
+            path can no longer be told apart from a folder.
+            """
+            if os.path.splitext(path)[1] in _WATCH_EXTENSIONS:
+                return True
+            return change == Change.deleted or os.path.isdir(path)
+
+        def report(files_found: int, new_files: int):
+            flush_queue()
+
+            # Update shared state
+            shared_state.total_files_found.value = len(processed_files)
+            
+            # Send status update
+            status_queue.put({
+                'process': 'watcher',
+                'status': 'running',
+                'stats': {
+                    'files_found': files_found,
+                    'new_files': new_files,
+                    'total_tracked': len(processed_files),
+                    'last_scan': time.time()
+                }
+            })
+        
+        try:
+            report(*scan_folders())
+
+            existing_folders = [folder for folder in folders if folder.exists()]
+            if watch_changes is not None and existing_folders:
+                # Event driven: wake only when something under the folders changes
+                for changes in watch_changes(
+                    *existing_folders,
+                    watch_filter=watch_filter,
+                    stop_event=shutdown_event,
+                    recursive=recursive,
+                    raise_interrupt=False,
+                ):
+                    # A batch is unordered: a path deleted and re-created (atomic
+                    # saves) is only forgotten if it is still gone
+                    deleted = {
+                        Path(changed_path) for change, changed_path in changes
+                        if change == Change.deleted and not os.path.lexists(changed_path)
+                    }
+                    if deleted:
+                        forget_deleted(deleted)
+
+                    new_files = 0
+                    for change, changed_path in changes:
+                        if change == Change.deleted:
+                            continue
+                        file_path = Path(changed_path)
+                        if recursive and change == Change.added and file_path.is_dir():
+                            # Files can land in a new directory before it is watched
+                            new_files += scan_folder(file_path)[1]
+                            continue
+                        if file_path.suffix not in _WATCH_EXTENSIONS:
+                            continue
+                        if not file_path.is_file():
+                            continue
+                        if check_file(file_path):
+                            new_files += 1
+                    # Only changed paths were checked; every matching file still
+                    # present has a fingerprint, so that is the files-found total
+                    report(len(file_fingerprints), new_files)
+            else:
+                # Polling: wait, then rescan everything
+                while not shutdown_event.wait(timeout=scan_interval):
+                    report(*scan_folders())
                 
         except Exception as e:
             logger.error(f"Watcher process error: {e}")
@@ -359,7 +505,7 @@ class ProcessManager:
         progress_queue: mp.Queue,
         status_queue: mp.Queue,
         shutdown_event: mp.Event,
-        shared_state: Dict
+        shared_state: SharedState
     ):
         """Ingestion worker process."""
         import asyncio
@@ -376,6 +522,7 @@ class ProcessManager:
         
         logger.info("Ingestion worker started")
         
+        loop = None
         try:
             # Initialize LightRAG in this process
             from lightrag_core import create_lightrag_core
@@ -395,6 +542,11 @@ class ProcessManager:
                 max_daily_cost_usd=float(os.environ.get("HYBRIDRAG_MAX_DAILY_COST_USD", "5.0")),
             )
             
+            # One event loop for the worker's lifetime; LightRAG's async locks
+            # and clients stay bound to it between batches
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            
             # Send initial status
             status_queue.put({
                 'process': 'ingestion',
@@ -411,16 +563,81 @@ class ProcessManager:
             pending_files = []
             processing_start = None
             
+            def send_progress(total_files: int, current_file: str, remaining_files: int):
+                elapsed_time = time.time() - processing_start
+                processing_rate = processed_count / max(elapsed_time / 60, 0.1)  # files per minute
+                progress_queue.put({
+                    'type': 'progress',
+                    'total_files': total_files,
+                    'processed_files': processed_count,
+                    'current_file': current_file,
+                    'errors': error_count,
+                    'processing_rate': processing_rate,
+                    'estimated_remaining': remaining_files / max(processing_rate, 0.1) if processing_rate > 0 else 0
+                })
+            
+            async def insert_batch(ready: list, total_files: int):
+                """Insert (file_info, content) pairs concurrently, reporting each as it finishes."""
+                nonlocal processed_count, error_count
+                
+                async def insert(file_info, content):
+                    try:
+                        await lightrag_core.ainsert(content, file_path=file_info['path'])
+                    except Exception as e:
+                        return file_info, e
+                    return file_info, None
+                
+                in_flight = [file_info for file_info, _ in ready]
+                send_progress(total_files, in_flight[0]['name'], len(pending_files) + len(in_flight))
+                
+                for next_done in asyncio.as_completed([insert(*item) for item in ready]):
+                    file_info, error = await next_done
+                    in_flight.remove(file_info)
+                    
+                    if error is not None:
+                        logger.error(f"Error processing {file_info['path']}: {error}")
+                        error_count += 1
+                    else:
+                        try:
+                            tracker.mark_file_processed(FileInfo(
+                                path=file_info['path'],
+                                size=file_info['size'],
+                                modified_time=file_info.get('modified', 0.0),
+                                hash=file_info['hash'],
+                                extension=file_info['extension'],
+                                status='processed',
+                                ingested_at=datetime.now(),
+                            ))
+                        except Exception as e:
+                            logger.error(f"Error marking file processed: {e}")
+                        
+                        processed_count += 1
+                        logger.info(f"Successfully processed: {file_info['path']}")
+                    
+                    send_progress(
+                        total_files,
+                        in_flight[0]['name'] if in_flight else '',
+                        len(pending_files) + len(in_flight)
+                    )
+            
             while not shutdown_event.is_set():
-                # Collect files from queue
+                # Collect files from queue: block for the first batch only when
+                # idle, then drain whatever else has arrived
                 new_files = []
                 try:
-                    while not file_queue.empty():
-                        file_info = file_queue.get_nowait()
-                        new_files.append(file_info)
-                        pending_files.append(file_info)
-                except:
+                    if pending_files:
+                        items = file_queue.get_nowait()
+                    else:
+                        items = file_queue.get(timeout=2.0)
+                    while True:
+                        # The watcher sends lists of file infos
+                        if not isinstance(items, list):
+                            items = [items]
+                        new_files.extend(items)
+                        items = file_queue.get_nowait()
+                except queue.Empty:
                     pass
+                pending_files.extend(new_files)
                 
                 if new_files:
                     logger.info(f"Received {len(new_files)} new files for processing")
@@ -430,7 +647,7 @@ class ProcessManager:
                     if not processing_start:
                         processing_start = time.time()
                     
-                    shared_state['ingestion_active'] = True
+                    shared_state.ingestion_active.set()
                     
                     # Process in batches
                     batch_size = min(5, len(pending_files))
@@ -440,27 +657,13 @@ class ProcessManager:
                     # Create progress bar info
                     total_files = processed_count + error_count + len(pending_files) + len(current_batch)
                     
-                    for i, file_info in enumerate(current_batch):
+                    ready = []  # (file_info, content) to insert together
+                    for file_info in current_batch:
                         if shutdown_event.is_set():
                             break
                         
+                        file_info.setdefault('name', os.path.basename(file_info['path']))
                         try:
-                            # Send progress update
-                            elapsed_time = time.time() - processing_start
-                            processing_rate = (processed_count + i) / max(elapsed_time / 60, 0.1)  # files per minute
-                            remaining_files = len(pending_files) + len(current_batch) - i - 1
-                            estimated_remaining = remaining_files / max(processing_rate, 0.1) if processing_rate > 0 else 0
-                            
-                            progress_queue.put({
-                                'type': 'progress',
-                                'total_files': total_files,
-                                'processed_files': processed_count + i,
-                                'current_file': os.path.basename(file_info['path']),
-                                'errors': error_count,
-                                'processing_rate': processing_rate,
-                                'estimated_remaining': estimated_remaining
-                            })
-                            
                             # Process the file
                             logger.info(f"Processing: {file_info['path']}")
                             
@@ -497,24 +700,7 @@ class ProcessManager:
                                     call_type='embed',
                                 )
 
-                                # Ingest into LightRAG with source file path
-                                asyncio.run(lightrag_core.ainsert(content, file_path=file_info['path']))
-
-                                try:
-                                    tracker.mark_file_processed(FileInfo(
-                                        path=file_info['path'],
-                                        size=file_info['size'],
-                                        modified_time=file_info.get('modified', 0.0),
-                                        hash=file_info['hash'],
-                                        extension=file_info['extension'],
-                                        status='processed',
-                                        ingested_at=datetime.now(),
-                                    ))
-                                except Exception as e:
-                                    logger.error(f"Error marking file processed: {e}")
-
-                                processed_count += 1
-                                logger.info(f"Successfully processed: {file_info['path']}")
+                                ready.append((file_info, content))
                                 
                             else:
                                 logger.warning(f"Empty content from: {file_info['path']}")
@@ -524,22 +710,19 @@ class ProcessManager:
                             logger.error(f"Error processing {file_info['path']}: {e}")
                             error_count += 1
                     
+                    # Ingest into LightRAG with source file paths. The inserts mostly
+                    # wait on embedding/LLM calls, so the batch runs concurrently.
+                    if ready:
+                        loop.run_until_complete(insert_batch(ready, total_files))
+                    
                     # Update shared state
-                    shared_state['total_files_processed'] = processed_count
+                    shared_state.total_files_processed.value = processed_count
                     
                     # Send final progress for this batch
-                    progress_queue.put({
-                        'type': 'progress',
-                        'total_files': total_files,
-                        'processed_files': processed_count,
-                        'current_file': '',
-                        'errors': error_count,
-                        'processing_rate': processing_rate,
-                        'estimated_remaining': len(pending_files) / max(processing_rate, 0.1) if processing_rate > 0 else 0
-                    })
+                    send_progress(total_files, '', len(pending_files))
                 
                 if not pending_files:
-                    shared_state['ingestion_active'] = False
+                    shared_state.ingestion_active.clear()
                     processing_start = None
                 
                 # Send status update
@@ -553,12 +736,9 @@ class ProcessManager:
                         'processing_active': len(pending_files) > 0
                     }
                 })
-                
-                # Wait a bit before checking for more files
-                shutdown_event.wait(timeout=2.0)
             
             # Mark LightRAG as ready
-            shared_state['lightrag_ready'] = True
+            shared_state.lightrag_ready.set()
             
         except Exception as e:
             logger.error(f"Ingestion worker error: {e}")
@@ -567,6 +747,9 @@ class ProcessManager:
                 'status': 'error',
                 'error': str(e)
             })
+        finally:
+            if loop is not None:
+                loop.close()
         
         logger.info("Ingestion worker process shutdown")
 
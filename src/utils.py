@@ -5,6 +5,9 @@ HybridRAG Utility Functions
 Common utility functions for the HybridRAG system.
 """
 
+import os
+from typing import AbstractSet, Iterator
+
 
 def format_file_size(size_bytes: int) -> str:
     """
@@ -75,3 +78,42 @@ def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
     if len(text) <= max_length:
         return text
     return text[:max_length - len(suffix)] + suffix
+
+
+def iter_files(
+    folder: str,
+    recursive: bool = True,
+    skip_dirs: AbstractSet[str] = frozenset(),
+) -> Iterator[os.DirEntry]:
+    """
+    Yield a directory entry for every file in a folder.
+
+    Walks with os.scandir, so file type checks come from the directory
+    listing instead of a stat() per entry. Like Path.rglob, symlinked
+    directories are not descended into; unreadable directories and entries
+    are skipped.
+
+    Args:
+        folder: Folder to walk
+        recursive: Also walk subfolders
+        skip_dirs: Subfolder names never descended into
+
+    Returns:
+        Iterator of os.DirEntry for regular files (and symlinks to them)
+    """
+    pending = [folder]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive and entry.name not in skip_dirs:
+                            pending.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+                except OSError:
+                    pass
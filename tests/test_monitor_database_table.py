@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Monitor Database Table Tests
+============================
+Tests for DatabaseTable.update_databases() row diffing.
+
+Tests cover:
+- Appending a database adds a row without rebuilding the table
+- Removing a database drops its row and keeps the cursor on the selection
+- A changed stat patches only that database's cells
+- A reorder rebuilds the rows in the new order
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+pytest.importorskip("textual")
+
+from textual.app import App, ComposeResult
+
+from src.monitor.data_collector import DatabaseStats
+from src.monitor.widgets.database_table import DatabaseTable
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+class TableApp(App):
+    """Minimal app hosting a single DatabaseTable."""
+
+    def compose(self) -> ComposeResult:
+        yield DatabaseTable(id="databases")
+
+
+def make_db(name: str, **kwargs) -> DatabaseStats:
+    return DatabaseStats(
+        name=name,
+        path=f"/tmp/{name}",
+        source_folder=None,
+        source_type="filesystem",
+        **kwargs
+    )
+
+
+def row_names(table: DatabaseTable) -> list[str]:
+    return [row.key.value for row in table.ordered_rows]
+
+
+def run_with_table(scenario):
+    """Run scenario(table, pilot) against a mounted DatabaseTable."""
+    async def runner():
+        app = TableApp()
+        async with app.run_test() as pilot:
+            table = app.query_one(DatabaseTable)
+            await scenario(table, pilot)
+    asyncio.run(runner())
+
+
+def track_clears(table: DatabaseTable) -> list:
+    """Record calls to table.clear() while still clearing."""
+    calls = []
+    original = table.clear
+
+    def clear(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    table.clear = clear
+    return calls
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+class TestDatabaseTableDiffing:
+    """update_databases() patches rows in place where it can."""
+
+    def test_append_adds_row_in_place(self):
+        async def scenario(table, pilot):
+            table.update_databases([make_db("alpha"), make_db("beta")])
+            await pilot.pause()
+            clears = track_clears(table)
+
+            table.update_databases([make_db("alpha"), make_db("beta"), make_db("gamma")])
+            await pilot.pause()
+
+            assert clears == []
+            assert row_names(table) == ["alpha", "beta", "gamma"]
+            assert table.get_cell("gamma", "name") == "gamma"
+
+        run_with_table(scenario)
+
+    def test_remove_drops_row_and_keeps_selection(self):
+        async def scenario(table, pilot):
+            table.update_databases([make_db("alpha"), make_db("beta"), make_db("gamma")])
+            await pilot.pause()
+            table.move_cursor(row=2)
+            await pilot.pause()
+            clears = track_clears(table)
+
+            table.update_databases([make_db("beta"), make_db("gamma")])
+            await pilot.pause()
+
+            assert clears == []
+            assert row_names(table) == ["beta", "gamma"]
+            assert table.get_selected_database().name == "gamma"
+
+        run_with_table(scenario)
+
+    def test_changed_stat_patches_cells(self):
+        async def scenario(table, pilot):
+            table.update_databases([make_db("alpha"), make_db("beta", entity_count=5)])
+            await pilot.pause()
+            clears = track_clears(table)
+
+            table.update_databases([
+                make_db("alpha"),
+                make_db("beta", entity_count=1234, total_size_human="2.0 MB"),
+            ])
+            await pilot.pause()
+
+            assert clears == []
+            assert table.get_cell("beta", "entities") == "1,234"
+            assert table.get_cell("beta", "size") == "2.0 MB"
+            assert table.get_cell("alpha", "entities") == "-"
+            assert table.get_selected_database().entity_count == 0
+
+        run_with_table(scenario)
+
+    def test_unchanged_stats_refresh_selection(self):
+        async def scenario(table, pilot):
+            table.update_databases([make_db("alpha", entity_count=1)])
+            await pilot.pause()
+
+            fresh = make_db("alpha", entity_count=1)
+            table.update_databases([fresh])
+            await pilot.pause()
+
+            assert table.get_selected_database() is fresh
+
+        run_with_table(scenario)
+
+    def test_reorder_rebuilds_rows(self):
+        async def scenario(table, pilot):
+            table.update_databases([make_db("alpha"), make_db("beta"), make_db("gamma")])
+            await pilot.pause()
+            table.move_cursor(row=0)
+            await pilot.pause()
+            clears = track_clears(table)
+
+            table.update_databases([make_db("gamma"), make_db("alpha"), make_db("beta")])
+            await pilot.pause()
+
+            assert len(clears) == 1
+            assert row_names(table) == ["gamma", "alpha", "beta"]
+            assert table.get_selected_database().name == "alpha"
+
+        run_with_table(scenario)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
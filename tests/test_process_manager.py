@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Process Manager Shared State Tests
+==================================
+Tests for the counters and flags ProcessManager shares with its workers.
+
+Tests cover:
+- SharedState defaults and as_dict() shape
+- Counter and flag updates made in a child process
+- get_system_status() reporting the shared state
+"""
+
+import multiprocessing as mp
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.process_manager import ProcessManager, SharedState
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+def _update_from_child(shared_state: SharedState):
+    """Child process body: write every shared field the workers write."""
+    shared_state.total_files_found.value = 7
+    shared_state.total_files_processed.value = 3
+    shared_state.ingestion_active.set()
+    shared_state.lightrag_ready.set()
+
+
+def _run_child(shared_state: SharedState):
+    process = mp.Process(
+        target=_update_from_child,
+        args=(shared_state,)
+    )
+    process.start()
+    process.join(timeout=30)
+    assert process.exitcode == 0
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+class TestSharedState:
+    """SharedState values and their dict view."""
+
+    def test_defaults(self):
+        shared_state = SharedState()
+        assert shared_state.as_dict() == {
+            'watch_folders': [],
+            'total_files_found': 0,
+            'total_files_processed': 0,
+            'ingestion_active': False,
+            'lightrag_ready': False
+        }
+
+    def test_as_dict_copies_watch_folders(self):
+        shared_state = SharedState()
+        shared_state.watch_folders = ["./data"]
+        snapshot = shared_state.as_dict()
+        snapshot['watch_folders'].append("./other")
+        assert shared_state.watch_folders == ["./data"]
+
+    def test_child_updates_are_visible(self):
+        shared_state = SharedState()
+        _run_child(shared_state)
+        values = shared_state.as_dict()
+        assert values['total_files_found'] == 7
+        assert values['total_files_processed'] == 3
+        assert values['ingestion_active'] is True
+        assert values['lightrag_ready'] is True
+
+    def test_flags_can_be_cleared(self):
+        shared_state = SharedState()
+        shared_state.ingestion_active.set()
+        shared_state.ingestion_active.clear()
+        assert shared_state.as_dict()['ingestion_active'] is False
+
+
+class TestSystemStatus:
+    """ProcessManager reports SharedState through get_system_status()."""
+
+    def test_system_status_reports_child_updates(self):
+        manager = ProcessManager()
+        manager.shared_state.watch_folders = ["./data"]
+        _run_child(manager.shared_state)
+        status = manager.get_system_status()
+        assert status['shared_state'] == {
+            'watch_folders': ["./data"],
+            'total_files_found': 7,
+            'total_files_processed': 3,
+            'ingestion_active': True,
+            'lightrag_ready': True
+        }
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])